@@ -68,17 +68,11 @@ class Term:
         assert selector.size == len(choices) and selector.arity == 0
 
         length = len(choices[0])
-        solver = selector.solver
-        for choice in choices:
-            assert len(choice) == length
-            solver |= choice.solver
-
-        literals = []
-        for idx in range(length):
-            val = BitVec(solver, [choice[idx] for choice in choices])
-            val &= selector.table
-            literals.append(val.fold_any()[0])
+        assert all(len(choice) == length for choice in choices)
+        table = BitVec.concat(choices)
+        solver = selector.solver | table.solver
 
+        literals = solver.fold_choice(selector.table.literals, table.literals)
         assert len(literals) == length
         return BitVec(solver, literals)
 
@@ -102,13 +96,14 @@ def find_algebra(terms: List[Term], size: int) -> Optional[SmallAlg]:
     (~Relation.tuples(size, 3, [[0, 0, 1], [0, 1, 0], [
      1, 0, 0], [1, 1, 0]]) | rel).ensure_all()
 
-    for oper in alg.operations:
-        oper.preserves(rel).ensure_all()
+    # the remaining constraints are forced together in a single call
+    checks = [oper.preserves(rel) for oper in alg.operations]
 
     diag = rel.polymer([0, 0, 0])
     for term in terms:
         val = term.evaluate(alg, [alg.encode_elem(0), alg.encode_elem(1)])
-        (~val | ~diag.table).ensure_all()
+        checks.append(~val | ~diag.table)
+    BitVec.concat(checks).ensure_all()
 
     if solver.solve():
         alg = alg.solution()
@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uasat import Solver, BitVec, Constant, Relation, Operation, SmallAlg, ProductAlg
 
 
@@ -39,17 +39,11 @@ class Generator:
         assert selector.size == len(choices) and selector.arity == 0
 
         length = len(choices[0])
-        solver = selector.solver
-        for choice in choices:
-            assert len(choice) == length
-            solver |= choice.solver
-
-        literals = []
-        for idx in range(length):
-            val = BitVec(solver, [choice[idx] for choice in choices])
-            val &= selector.table
-            literals.append(val.fold_any()[0])
+        assert all(len(choice) == length for choice in choices)
+        table = BitVec.concat(choices)
+        solver = selector.solver | table.solver
 
+        literals = solver.fold_choice(selector.table.literals, table.literals)
         assert len(literals) == length
         return BitVec(solver, literals)
 
@@ -147,16 +141,28 @@ def find_algebra(multi_steps: List[List[List[int]]], size: int = 2) -> Optional[
     elem0 = alg.encode_elem(0)
     elem1 = alg.encode_elem(1)
 
-    def term(steps, e0, e1, e2, e3):
-        e = [e0, e1, e2, e3]
+    # subterms are shared across the step lists, so each distinct
+    # application is only built once
+    nodes = [elem0, elem1]
+    index: Dict[Tuple[int, ...], int] = {}
+
+    def term(steps, n0, n1, n2, n3):
+        e = [n0, n1, n2, n3]
         for s in steps:
-            e.append(alg.apply(s[0], [e[s[1]], e[s[2]], e[s[3]], e[s[4]]]))
-        return e[-1]
+            key = (s[0], e[s[1]], e[s[2]], e[s[3]], e[s[4]])
+            node = index.get(key)
+            if node is None:
+                node = len(nodes)
+                nodes.append(alg.apply(
+                    s[0], [nodes[n] for n in key[1:]]))
+                index[key] = node
+            e.append(node)
+        return nodes[e[-1]]
 
     for steps in multi_steps:
-        tup0 = term(steps, elem0, elem0, elem1, elem1)
-        tup1 = term(steps, elem0, elem1, elem0, elem1)
-        tup2 = term(steps, elem1, elem0, elem0, elem0)
+        tup0 = term(steps, 0, 0, 1, 1)
+        tup1 = term(steps, 0, 1, 0, 1)
+        tup2 = term(steps, 1, 0, 0, 0)
         (tup0.comp_ne(tup1) | tup1.comp_ne(tup2)).ensure_all()
 
     if solver.solve():
@@ -13,7 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Optional, Sequence
+import functools
+from typing import Any, List, Optional, Sequence
 from uasat import Solver, BitVec, Constant, Relation, Operation, SmallAlg, Algebra
 
 
@@ -68,17 +69,11 @@ class Term:
         assert selector.size == len(choices) and selector.arity == 0
 
         length = len(choices[0])
-        solver = selector.solver
-        for choice in choices:
-            assert len(choice) == length
-            solver |= choice.solver
-
-        literals = []
-        for idx in range(length):
-            val = BitVec(solver, [choice[idx] for choice in choices])
-            val &= selector.table
-            literals.append(val.fold_any()[0])
+        assert all(len(choice) == length for choice in choices)
+        table = BitVec.concat(choices)
+        solver = selector.solver | table.solver
 
+        literals = solver.fold_choice(selector.table.literals, table.literals)
         assert len(literals) == length
         return BitVec(solver, literals)
 
@@ -89,13 +84,11 @@ def find_algebra(terms: List[Term], size: int, partop: bool) -> Optional[SmallAl
     alg = SmallAlg.variable(solver, size, [4, 4, 4, 4], partop=partop)
 
     if partop:
-        mask = [Solver.FALSE for _ in range(size ** 4)]
-        for i in range(size):
-            for j in range(size):
-                mask[(1 + size) * i + (size**2 + size**3) * j] = Solver.TRUE
-                mask[(1 + size**2) * i + (size + size**3) * j] = Solver.TRUE
-                mask[(1 + size + size**2) * i + (size**3) * j] = Solver.TRUE
-        mask = Relation(size, 4, BitVec(Solver.CALC, mask))
+        # the tuples of the form xxyy, xyxy and xxxy
+        diag = Relation.diagonal(size)
+        d01, d02, d12, d13, d23 = [diag.polymer(v, 4) for v in
+                                   [[0, 1], [0, 2], [1, 2], [1, 3], [2, 3]]]
+        mask = (d01 & d23) | (d02 & d13) | (d01 & d12)
 
         for oper in alg.operations:
             (oper.domain() ^ ~mask).ensure_all()
@@ -119,13 +112,14 @@ def find_algebra(terms: List[Term], size: int, partop: bool) -> Optional[SmallAl
     (~Relation.tuples(size, 3, [[0, 0, 1], [0, 1, 0], [
      1, 0, 0], [1, 1, 0]]) | rel).ensure_all()
 
-    for oper in alg.operations:
-        oper.preserves(rel).ensure_all()
+    # the remaining constraints are forced together in a single call
+    checks = [oper.preserves(rel) for oper in alg.operations]
 
     diag = rel.polymer([0, 0, 0])
     for term in terms:
         val = term.evaluate(alg, [alg.encode_elem(0), alg.encode_elem(1)])
-        (~val | ~diag.table).ensure_all()
+        checks.append(~val | ~diag.table)
+    BitVec.concat(checks).ensure_all()
 
     if solver.solve():
         alg = alg.solution()
@@ -139,9 +133,12 @@ def find_algebra(terms: List[Term], size: int, partop: bool) -> Optional[SmallAl
 def find_diag(alg: SmallAlg) -> Relation:
     rel = Relation.tuples(
         alg.size, 3, [[0, 0, 1], [0, 1, 0], [1, 0, 0], [1, 1, 0]])
+    # operations with identical tables only need to be applied once
+    opers = list({tuple(oper.table.literals): oper
+                  for oper in alg.operations}.values())
     while True:
         rel2 = rel
-        for oper in alg.operations:
+        for oper in opers:
             rel |= oper.apply(rel2)
 
         if rel2.comp_eq(rel).value():
@@ -153,6 +150,9 @@ def find_term(algs: Sequence[SmallAlg], depth: int) -> Optional[Term]:
 
     term = Term.variable(solver, [4, 4, 4, 4], 2, depth)
 
+    # repeated algebras would only add the same constraints again
+    algs = list({tuple(tuple(oper.table.literals) for oper in alg.operations): alg
+                 for alg in algs}.values())
     for alg in algs:
         diag = find_diag(alg)
 
@@ -167,732 +167,734 @@ def find_term(algs: Sequence[SmallAlg], depth: int) -> Optional[Term]:
         print("Term not solvable")
 
 
-ALGS1 = [
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 0, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 0, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 1, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 0, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 0, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 1, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 0, None,
-                         1, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         1, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 1, None, 1, None,
-                         0, 0, None, 0, None, 0, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 0, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 1, None,
-                         1, 1, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 1, None, 1, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 1, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         1, 0, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 1, None, None, 1]),
-        Operation(2, 4, [0, None, None, 0, None, 0, None,
-                         0, 1, None, 0, None, 1, None, None, 1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 2, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 2, None, None, 2, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 2, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 2, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 0, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, 1, None, 1, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, 1, None, 1, None, None, None, 1, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 1, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 1, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 1, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 1, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 1, 0, None, None, 1, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, None, 1, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 0, None, None, None, None, None, None, 1, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 1, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 0, None, None, None, None, None, 2, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 0, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 1, None, None, None, 0, None, 2, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 2, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 0, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 2, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 0, None, 1, None, None, None, 0, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 0, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 0, 1, None, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, 0, None, 1, None, None, None, 0, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 1, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 0, 1, None, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, 2, None, 2, None, None, None, 0, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 0, None, None, None, 1, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 0, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-        Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
-                         None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, 2, None, None, None,
-                         None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None,  None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None,
-                         None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None,
-                         None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 1, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 1, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 0, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 0, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 0, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 0, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 2, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 2, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-    SmallAlg([
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
-                         None, 1, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-        Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
-                         None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
-    ]),
-]
+@functools.lru_cache(maxsize=None)
+def algs1() -> List[SmallAlg]:
+    return [
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 0, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 0, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 1, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 0, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 0, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 1, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 0, None,
+                             1, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             1, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 1, None, 1, None,
+                             0, 0, None, 0, None, 0, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 0, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 1, None,
+                             1, 1, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 1, None, 1, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 1, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             1, 0, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 1, None, None, 1]),
+            Operation(2, 4, [0, None, None, 0, None, 0, None,
+                             0, 1, None, 0, None, 1, None, None, 1]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 2, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 2, None, None, 2, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 2, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 2, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 2, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 0, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, 1, None, 1, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, 1, None, 1, None, None, None, 1, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 2, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 1, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 1, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 1, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 1, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 1, 0, None, None, 1, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, None, 1, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 1, None, None, 0, None, None, None, None, None, None, 1, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 1, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 1, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 0, None, None, None, None, None, 2, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 1, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 0, None, 2, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 1, None, None, None, 0, None, 2, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 2, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 2, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, 2, None, 0, None, None, None, 1, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 0, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 0, None, None, 2, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 1, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 0, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 2, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 0, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 1, None, None, 2, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 2, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 0, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 2, 0, None, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, 0, None, 1, None, None, None, 0, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 0, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 0, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 0, 1, None, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, 0, None, 1, None, None, None, 0, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 1, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 0, 1, None, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, 2, None, 2, None, None, None, 0, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 0, None, None, None, 1, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 0, None, None, 1, 2, None, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 0, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, None, 2, 0, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 2, 0, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+            Operation(3, 4, [0, None, None, None, 2, None, None, None, 2, None, 0, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, None, 0, 1, None, None, 1, None, None, None, None, None, 1, None, None,
+                             None, 1, None, None, None, 1, None, None, None, None, None, 1, None, None, 1, 2, None, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, 2, None, 2, None, None, None, 2, None, None, None, 2]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, 2, None, None, None,
+                             None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None,  None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None,
+                             None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None,
+                             None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 2, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 1, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 1, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 0, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 2, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 0, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 0, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 0, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 2, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, 3, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 2, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 2, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 0, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 3, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, None, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 2, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 2, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 0, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, 1, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, None, None, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 2, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 0, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 3, None, 3, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 0, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, None, 3, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 0, None, None, None, None, 3, None, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 1, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 3, None, None, None, None, 2, None, None, None, None, 0, None, 2, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 3, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+        SmallAlg([
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 0, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 3, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 3, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, 2, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 3, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None,
+                             None, 1, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 2, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 0, None, None, None, None, 3, None, None, None, None, 1, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 3, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, 0, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+            Operation(4, 4, [0, None, None, None, None, 0, None, None, None, None, 0, None, None, None, None, 0, None, 0, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, 0, None, None, None, None, None, None, None, None, None, None, None, 0, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 1, None, None, None, None, None, None,
+                             None, 1, 2, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 1, None, None, None, None, None, None, 1, None, None, None, None, 1, None, None, None, None, 2, None, None, None, None, 2, None, None, None, None, None, None, None, None, None, None, None, 2, None, None, None, 2, 3, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, None, 3, None, None, None, None, None, None, None, 1, None, None, None, None, None, None, None, None, None, None, None, None, 3, None, None, None, 1, None, 3, None, None, None, None, 1, None, None, None, None, 3, None, None, None, None, 3]),
+        ]),
+    ]
 
 
 def test1():
-    algs = list(ALGS1)
+    algs = list(algs1())
 
     next_alg = None
     terms = []
@@ -912,428 +914,430 @@ def test1():
     print(next_alg)
 
 
-ALGS2 = [
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 1, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2,
-                         2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 0, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2]),
-        Operation(3, 4, [0, 2, 2, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2,
-                         2, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 0, 2, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2,
-                         2, 1, 1, 1, 2, 2, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1,
-                         1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 1, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 1, 0, 1, 1, 0, 0, 1, 2, 0, 1, 0, 1, 1, 0, 0, 1, 0, 2, 1, 0, 0, 1, 0, 0, 1, 2, 0, 1, 1, 1, 1, 2, 1, 1, 0, 0, 1,
-                         2, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 1, 0, 0, 1, 0, 1, 1, 0, 0, 1, 0, 2, 1, 1, 2, 1, 2, 0, 1, 0, 1, 1, 0, 0, 1, 2]),
-        Operation(3, 4, [0, 0, 0, 1, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 1, 1, 2, 1, 2, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 1,
-                         0, 1, 1, 1, 2, 2, 2, 0, 2, 2, 1, 1, 1, 2, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 1, 1, 1, 2, 1, 2, 0, 2, 0, 1, 1, 1, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 0, 0, 2, 2, 1, 1, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1,
-                         2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2]),
-        Operation(3, 4, [0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1,
-                         2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2]),
-        Operation(3, 4, [0, 2, 2, 1, 1, 1, 2, 2, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 1, 2,
-                         2, 1, 1, 1, 2, 2, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
-    ]),
-    SmallAlg([
-        Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1]),
-        Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 2, 0, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2,
-                         2, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 0, 1, 2, 2, 2, 2, 2, 2, 1, 2,
-                         2, 2, 1, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1,
-                         2, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 0,
-                         0, 1, 1, 1, 2, 2, 2, 2, 2, 0, 1, 1, 2, 2, 2, 2, 0, 0, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2, 1, 1, 2, 2, 1, 2, 2, 0,
-                         2, 1, 1, 2, 2, 1, 2, 2, 1, 2, 1, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 2, 2, 0, 2, 2, 0, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 2, 2, 2, 1, 2, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 2, 0, 0, 0, 1, 1, 2, 2, 2, 2, 0, 0,
-                         0, 1, 1, 1, 2, 2, 2, 0, 0, 2, 2, 2, 1, 2, 2, 2, 0, 0, 0, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 2, 2, 2, 2, 0, 0, 0, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 2, 2, 1, 1, 2, 2, 2, 2, 0, 0, 2, 1, 1, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2, 0, 2,
-                         2, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 2, 1, 2, 2, 2, 2, 2, 0, 1, 2, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 2, 1, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 2, 2, 2, 2, 0, 0, 0, 0, 2, 2, 1, 2, 2, 0, 2, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 1,
-                         2, 1, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 1, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 0, 1, 2, 0, 2, 2, 0, 2, 2, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 0, 1, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2]),
-        Operation(3, 4, [0, 0, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-                         1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 2, 2, 0, 2, 0, 2, 2, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 2, 2, 0, 2, 2, 0, 2, 2, 1,
-                         2, 1, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 2, 2, 0, 2, 2, 0, 2, 2, 1, 1, 1, 0, 1, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
-                         2, 2, 1, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2]),
-        Operation(3, 4, [0, 2, 2, 0, 0, 0, 0, 2, 0, 2, 0, 2, 2, 1, 2, 2, 0, 0, 2, 2, 2, 0, 1, 0, 2, 0, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2,
-                         2, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 4, [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1,
-                         1, 1, 1, 1, 2, 1, 2, 2, 2, 1, 1, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-    ]),
-]
+@functools.lru_cache(maxsize=None)
+def algs2() -> List[SmallAlg]:
+    return [
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 0, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 1, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2,
+                             2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 0, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2]),
+            Operation(3, 4, [0, 2, 2, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2,
+                             2, 0, 1, 1, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 0, 2, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2,
+                             2, 1, 1, 1, 2, 2, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1,
+                             1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 1, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 1, 0, 1, 1, 0, 0, 1, 2, 0, 1, 0, 1, 1, 0, 0, 1, 0, 2, 1, 0, 0, 1, 0, 0, 1, 2, 0, 1, 1, 1, 1, 2, 1, 1, 0, 0, 1,
+                             2, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 1, 0, 0, 1, 0, 1, 1, 0, 0, 1, 0, 2, 1, 1, 2, 1, 2, 0, 1, 0, 1, 1, 0, 0, 1, 2]),
+            Operation(3, 4, [0, 0, 0, 1, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 1, 1, 2, 1, 2, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 1,
+                             0, 1, 1, 1, 2, 2, 2, 0, 2, 2, 1, 1, 1, 2, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 1, 1, 1, 2, 1, 2, 0, 2, 0, 1, 1, 1, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 0, 0, 2, 2, 1, 1, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1,
+                             2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2]),
+            Operation(3, 4, [0, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1,
+                             2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 2]),
+            Operation(3, 4, [0, 2, 2, 1, 1, 1, 2, 2, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 1, 2,
+                             2, 1, 1, 1, 2, 2, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 1]),
+        ]),
+        SmallAlg([
+            Operation(2, 4, [0, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            Operation(2, 4, [0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1]),
+            Operation(2, 4, [0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 2, 0, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2,
+                             2, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 0, 1, 2, 2, 2, 2, 2, 2, 1, 2,
+                             2, 2, 1, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1,
+                             2, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 0,
+                             0, 1, 1, 1, 2, 2, 2, 2, 2, 0, 1, 1, 2, 2, 2, 2, 0, 0, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2, 1, 1, 2, 2, 1, 2, 2, 0,
+                             2, 1, 1, 2, 2, 1, 2, 2, 1, 2, 1, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 2, 2, 0, 2, 2, 0, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 2, 2, 2, 1, 2, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 2, 0, 0, 0, 1, 1, 2, 2, 2, 2, 0, 0,
+                             0, 1, 1, 1, 2, 2, 2, 0, 0, 2, 2, 2, 1, 2, 2, 2, 0, 0, 0, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 2, 2, 2, 2, 0, 0, 0, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 2, 2, 1, 1, 2, 2, 2, 2, 0, 0, 2, 1, 1, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 2, 2, 0, 2,
+                             2, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 2, 1, 2, 2, 2, 2, 2, 0, 1, 2, 1, 2, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 2, 0, 2, 0, 1, 2, 1, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 2, 2, 2, 2, 0, 0, 0, 0, 2, 2, 1, 2, 2, 0, 2, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 1,
+                             2, 1, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 1, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 0, 1, 2, 0, 2, 2, 0, 2, 2, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 0, 1, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2]),
+            Operation(3, 4, [0, 0, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 2, 0, 0, 0, 0, 0, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 0, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                             1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 2, 2, 0, 2, 0, 2, 2, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 2, 2, 0, 2, 2, 0, 2, 2, 1,
+                             2, 1, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 2, 2, 0, 2, 2, 0, 2, 2, 1, 1, 1, 0, 1, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
+                             2, 2, 1, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 2, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2]),
+            Operation(3, 4, [0, 2, 2, 0, 0, 0, 0, 2, 0, 2, 0, 2, 2, 1, 2, 2, 0, 0, 2, 2, 2, 0, 1, 0, 2, 0, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2,
+                             2, 2, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            Operation(3, 4, [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1,
+                             1, 1, 1, 1, 2, 1, 2, 2, 2, 1, 1, 1, 2, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+        ]),
+    ]
 
 
 def test2():
-    algs = list(ALGS2)
+    algs = list(algs2())
 
     next_alg = None
     terms = []
@@ -1353,6 +1357,15 @@ def test2():
     print(next_alg)
 
 
+def __getattr__(name: str) -> Any:
+    # the algebra lists are only built when first used
+    if name == 'ALGS1':
+        return algs1()
+    elif name == 'ALGS2':
+        return algs2()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == '__main__':
     import sys
     if sys.argv[1] == "test1":
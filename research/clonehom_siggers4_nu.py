@@ -13,8 +13,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import array
+import concurrent.futures
+import functools
+import itertools
 import math
-from typing import Any, List, Sequence, Optional, Tuple
+import os
+from typing import Any, Dict, List, Sequence, Optional, Tuple
 from uasat import Solver, BitVec, Constant, Relation, Operation
 
 
@@ -41,6 +46,8 @@ class SmallAlg(Algebra):
         super().__init__(operations[0].size, operations[0].size,
                          [op.arity for op in operations])
         self.operations = operations
+        self.cache_solver = Solver.CALC
+        self.cache: Dict[Tuple[int, Tuple[Tuple[int, ...], ...]], BitVec] = {}
 
     @staticmethod
     def unknown(solver: Solver, size: int, signature: List[int]) -> 'SmallAlg':
@@ -51,19 +58,46 @@ class SmallAlg(Algebra):
 
     def apply(self, op: int, args: List[BitVec]) -> BitVec:
         assert len(args) == self.signature[op]
-        hack = self.operations[op]
-        hack = Operation(hack.size, hack.arity, hack.table)
-        elems = [Constant(self.size, arg) for arg in args]
-        res = hack.compose(elems)
-        assert res.length == self.size
-        return res.table
+
+        # constant arguments just select a row of the table
+        values = [None if arg.solver else Constant(self.size, arg).decode()
+                  for arg in args]
+        if all(val is not None for val in values):
+            pos = 0
+            for val in reversed(values):
+                pos = pos * self.size + val
+            table = self.operations[op].table
+            return table.slice(pos * self.size, (pos + 1) * self.size)
+
+        # the cached literals are only valid within a single solver
+        solver = Solver.join_all(
+            [self.operations[op].solver] + [arg.solver for arg in args])
+        if solver is not self.cache_solver:
+            self.cache_solver = solver
+            self.cache.clear()
+
+        key = (op, tuple(tuple(arg.literals) for arg in args))
+        if key in self.cache:
+            return self.cache[key]
+
+        # select the row of the table at the position given by the arguments
+        positions = [Solver.TRUE]
+        for arg in reversed(args):
+            assert len(arg) == self.size
+            positions = solver.bool_and_outer(positions, arg.literals)
+        table = self.operations[op].table
+        res = BitVec(solver, solver.fold_choice(positions, table.literals))
+        assert len(res) == self.size
+        self.cache[key] = res
+        return res
 
     def element(self, index: int) -> BitVec:
         assert 0 <= index < self.size
         return Constant.constant(self.size, index).table
 
     def decode_elem(self, elem: BitVec) -> Any:
-        return Operation(self.size, 0, elem.solution()).decode()[0]
+        literals = elem.solution().literals
+        return literals.index(Solver.TRUE) if Solver.TRUE in literals else None
 
     def solution(self) -> 'SmallAlg':
         return SmallAlg([op.solution() for op in self.operations])
@@ -78,52 +112,36 @@ class SmallAlg(Algebra):
 
 class ProductAlg(Algebra):
     def __init__(self, factors: Sequence[Algebra]):
-        size = math.prod(a.size for a in factors)
-        length = sum(a.length for a in factors)
+        offsets = [0] + list(itertools.accumulate(a.length for a in factors))
         assert all(a.signature == factors[0].signature for a in factors)
-        super().__init__(size, length, factors[0].signature)
+        super().__init__(math.prod(a.size for a in factors), offsets[-1],
+                         factors[0].signature)
         self.factors = list(factors)
+        self.offsets = offsets
 
     def apply(self, op: int, args: List[BitVec]) -> BitVec:
-        solver = Solver.CALC
-        literals = []
-        start = 0
-        for alg in self.factors:
-            subargs = [arg.slice(start, start + alg.length) for arg in args]
-            part = alg.apply(op, subargs)
-            solver |= part.solver
-            literals.extend(part.literals)
-            start += alg.length
-        assert start == self.length
-        return BitVec(solver, literals)
+        parts = []
+        for alg, start, stop in zip(self.factors, self.offsets, self.offsets[1:]):
+            subargs = [arg.slice(start, stop) for arg in args]
+            parts.append(alg.apply(op, subargs))
+        return self.combine(parts)
 
     def combine(self, parts: List[BitVec]) -> BitVec:
         assert len(parts) == len(self.factors)
-        solver = Solver.CALC
-        literals = []
-        for part in parts:
-            solver |= part.solver
-            literals += part.literals
-        assert len(literals) == self.length
-        return BitVec(solver, literals)
+        elem = BitVec.concat(parts)
+        assert len(elem) == self.length
+        return elem
 
     def takeapart(self, elem: BitVec) -> List[BitVec]:
         assert len(elem) == self.length
-        parts = []
-        start = 0
-        for alg in self.factors:
-            parts.append(elem.slice(start, start + alg.length))
-            start += alg.length
-        return parts
+        return [elem.slice(start, stop)
+                for start, stop in zip(self.offsets, self.offsets[1:])]
 
     def decode_elem(self, elem: BitVec) -> List[Any]:
-        result = []
-        start = 0
-        for alg in self.factors:
-            part = elem.slice(start, start + alg.length)
-            result.append(alg.decode_elem(part))
-            start += alg.length
-        return result
+        # read the model once, the factors then decode calculator slices
+        elem = elem.solution()
+        return [alg.decode_elem(elem.slice(start, stop))
+                for alg, start, stop in zip(self.factors, self.offsets, self.offsets[1:])]
 
 
 class Generator:
@@ -135,65 +153,106 @@ class Generator:
 
         assert arity >= 3
         self.arity = arity
-        self.alg = ProductAlg(algs)
-        elem0 = self.alg.combine([alg.operations[1].table for alg in algs])
-        elem1 = self.alg.combine([alg.operations[2].table for alg in algs])
-        elem2 = self.alg.combine([alg.operations[3].table for alg in algs])
+        # private copies of the algebras, so that their apply caches are
+        # released with this generator and do not pin the solver in the
+        # shared lru_cached instances
+        self.alg = ProductAlg([SmallAlg(alg.operations) for alg in algs])
+        lits0, lits1, lits2 = [], [], []
+        for alg in algs:
+            lits0.extend(alg.operations[1].table.literals)
+            lits1.extend(alg.operations[2].table.literals)
+            lits2.extend(alg.operations[3].table.literals)
+        solver = Solver.join_all(
+            alg.operations[idx].solver for alg in algs for idx in [1, 2, 3])
+        elem0 = BitVec(solver, lits0)
+        elem1 = BitVec(solver, lits1)
+        elem2 = BitVec(solver, lits2)
 
         self.rel = ProductAlg([self.alg, self.alg])
-        self.tuples = []
-        self.tuples.append(self.rel.combine([elem0, elem1]))
-        self.tuples.append(self.rel.combine([elem1, elem0]))
-        self.tuples.append(self.rel.combine([elem1, elem2]))
-        self.tuples.append(self.rel.combine([elem2, elem0]))
+
+        # the tuples are stored as the rows of a single literal matrix
+        self.matrix = array.array('i')
+        self.num_tuples = 0
+        self.add_tuple(self.rel.combine([elem0, elem1]))
+        self.add_tuple(self.rel.combine([elem1, elem0]))
+        self.add_tuple(self.rel.combine([elem1, elem2]))
+        self.add_tuple(self.rel.combine([elem2, elem0]))
 
         self.steps: List[List[Constant]] = []
 
-    @staticmethod
-    def choice(selector: Constant, choices: List[BitVec]) -> BitVec:
-        assert selector.size == len(choices) and selector.arity == 0
-
-        length = len(choices[0])
-        solver = selector.solver
-        for choice in choices:
-            assert len(choice) == length
-            solver |= choice.solver
-
-        literals = []
-        for idx in range(length):
-            val = BitVec(solver, [choice[idx] for choice in choices])
-            val &= selector.table
-            literals.append(val.fold_any()[0])
-
-        assert len(literals) == length
+    def add_tuple(self, tup: BitVec):
+        assert len(tup) == self.rel.length
+        self.matrix.extend(tup.literals)
+        self.num_tuples += 1
+
+    def get_tuple(self, index: int) -> BitVec:
+        assert 0 <= index < self.num_tuples
+        length = self.rel.length
+        return BitVec(self.solver,
+                      self.matrix[index * length:(index + 1) * length])
+
+    def choice(self, selector: Constant) -> BitVec:
+        assert selector.size == self.num_tuples and selector.arity == 0
+
+        solver = selector.solver | self.solver
+        literals = solver.fold_choice(selector.table.literals, self.matrix)
+        assert len(literals) == self.rel.length
         return BitVec(solver, literals)
 
     def add_step(self):
         sels = []
         args = []
         for _ in range(self.arity):
-            sel = Constant.variable(len(self.tuples), self.solver)
+            sel = Constant.variable(self.num_tuples, self.solver)
             sels.append(sel)
 
-            arg = Generator.choice(sel, self.tuples)
+            arg = self.choice(sel)
             args.append(arg)
 
         out = self.rel.apply(0, args)
-        assert len(out) == self.rel.length
-
-        self.tuples.append(out)
+        self.add_tuple(out)
         self.steps.append(sels)
 
     def final_loop(self):
-        last = self.rel.takeapart(self.tuples[-1])
+        last = self.rel.takeapart(self.get_tuple(self.num_tuples - 1))
         assert len(last) == 2
-        last[0].comp_eq(last[1]).ensure_all()
+        last[0].ensure_eq(last[1])
+
+    def add_algebra(self, alg: SmallAlg, guard: int = Solver.TRUE):
+        """
+        Requires that the term built by the existing steps also closes the
+        loop in the given algebra, but only when the guard literal is true.
+        Passing a fresh guard as an assumption lets the constraint be tried
+        and later retired by adding the negated guard as a unit clause.
+        """
+
+        assert alg.signature == [self.arity, 0, 0, 0]
+        elem0 = alg.operations[1].table
+        elem1 = alg.operations[2].table
+        elem2 = alg.operations[3].table
+
+        rel = ProductAlg([alg, alg])
+        matrix = array.array('i')
+        for tup in [rel.combine([elem0, elem1]), rel.combine([elem1, elem0]),
+                    rel.combine([elem1, elem2]), rel.combine([elem2, elem0])]:
+            matrix.extend(tup.literals)
+
+        for sels in self.steps:
+            args = [BitVec(self.solver,
+                           self.solver.fold_choice(sel.table.literals, matrix))
+                    for sel in sels]
+            out = rel.apply(0, args)
+            matrix.extend(out.literals)
+
+        last = rel.takeapart(BitVec(self.solver, matrix[-rel.length:]))
+        equ = last[0].comp_eq(last[1])[0]
+        self.solver.add_clause2(Solver.bool_not(guard), equ)
 
     def decode(self) -> Optional[List[List[int]]]:
         if False:
             print("Tuples:")
-            for t in self.tuples:
-                print(self.rel.decode_elem(t))
+            for i in range(self.num_tuples):
+                print(self.rel.decode_elem(self.get_tuple(i)))
 
         print("Steps:")
         steps = []
@@ -215,675 +274,795 @@ def find_term(arity: int, algs: List[SmallAlg], num_steps: int) -> Optional[List
         print("Term not solvable")
 
 
-def find_algebra(size: int, gens: Tuple[int, int, int], arity: int, multi_steps: List[List[List[int]]]) -> Optional[SmallAlg]:
-    solver = Solver()
-    alg = SmallAlg([
-        Operation.variable(size, arity, solver),
-        Constant.constant(size, gens[0]),
-        Constant.constant(size, gens[1]),
-        Constant.constant(size, gens[2]),
-    ])
-
-    op = alg.operations[0]
-
-    for idx in range(arity):
-        new_vars = [0] * idx + [1] + [0] * (arity - idx - 1)
-        op.polymer(new_vars).comp_eq(
-            Operation.projection(size, 2, 0)).ensure_all()
-
-    elem0 = alg.operations[1].table
-    elem1 = alg.operations[2].table
-    elem2 = alg.operations[3].table
-
-    def term(steps, e0, e1, e2, e3):
-        e = [e0, e1, e2, e3]
+def pack_alg(alg: SmallAlg) -> Tuple[int, List[int], List[List[int]]]:
+    """
+    Returns the size, signature and solved table literals of the algebra,
+    which can be sent to another process unlike the solver itself.
+    """
+    return (alg.size, alg.signature,
+            [op.solution().table.literals for op in alg.operations])
+
+
+def unpack_alg(packed: Tuple[int, List[int], List[List[int]]]) -> SmallAlg:
+    size, signature, tables = packed
+    return SmallAlg([Operation(size, arity, BitVec(Solver.CALC, literals))
+                     for arity, literals in zip(signature, tables)])
+
+
+def _find_term_one(item: Tuple[int, List[Tuple[int, List[int], List[List[int]]]], int]) -> Tuple[int, Optional[List[List[int]]]]:
+    arity, packed, num_steps = item
+    algs = [unpack_alg(p) for p in packed]
+    return num_steps, find_term(arity, algs, num_steps)
+
+
+def find_term_parallel(arity: int, algs: List[SmallAlg], step_counts: List[int]) -> Optional[List[List[int]]]:
+    """
+    Runs find_term for each of the given step counts in a separate process
+    and returns the term for the smallest step count that has one. The
+    workers are stopped as soon as all smaller step counts have failed.
+    """
+
+    packed = [pack_alg(alg) for alg in algs]
+    items = [(arity, packed, num_steps) for num_steps in step_counts]
+
+    results: Dict[int, Optional[List[List[int]]]] = {}
+    best: Optional[int] = None
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count())
+    try:
+        futures = [executor.submit(_find_term_one, item) for item in items]
+        for future in concurrent.futures.as_completed(futures):
+            num_steps, steps = future.result()
+            results[num_steps] = steps
+            if steps and (best is None or num_steps < best):
+                best = num_steps
+            if best is not None and all(
+                    n in results for n in step_counts if n < best):
+                break
+    finally:
+        # shutdown only cancels the pending searches, the solvers that are
+        # still running are killed so that the exit does not wait for them
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    return None if best is None else results[best]
+
+
+class AlgebraFinder:
+    def __init__(self, size: int, gens: Tuple[int, int, int], arity: int):
+        self.solver = Solver()
+        self.alg = SmallAlg([
+            Operation.variable(size, arity, self.solver),
+            Constant.constant(size, gens[0]),
+            Constant.constant(size, gens[1]),
+            Constant.constant(size, gens[2]),
+        ])
+
+        # all near-unanimity identities are asserted in a single batch
+        op = self.alg.operations[0]
+        proj = Operation.projection(size, 2, 0).table
+        BitVec.concat([
+            op.polymer([0] * idx + [1] + [0] * (arity - idx - 1)).table
+            for idx in range(arity)
+        ]).ensure_eq(BitVec.concat([proj] * arity))
+
+    def term(self, steps: List[List[int]], elems: List[BitVec]) -> BitVec:
+        elems = list(elems)
         for step in steps:
-            e.append(alg.apply(0, [e[s] for s in step]))
-        return e[-1]
+            elems.append(self.alg.apply(0, [elems[s] for s in step]))
+        return elems[-1]
 
-    for steps in multi_steps:
-        tup0 = term(steps, elem0, elem1, elem1, elem2)
-        tup1 = term(steps, elem1, elem0, elem2, elem0)
+    def add_steps(self, steps: List[List[int]]):
+        """
+        Adds the constraint that the given term fails in the algebra. The
+        clauses only accumulate, so the solver is kept between calls.
+        """
+
+        elem0 = self.alg.operations[1].table
+        elem1 = self.alg.operations[2].table
+        elem2 = self.alg.operations[3].table
+
+        tup0 = self.term(steps, [elem0, elem1, elem1, elem2])
+        tup1 = self.term(steps, [elem1, elem0, elem2, elem0])
         tup0.comp_ne(tup1).ensure_all()
 
-    if solver.solve():
-        solution = alg.solution()
-        print(solution)
-        return solution
-    else:
-        print("Algebra not solvable")
+    def solve(self) -> Optional[SmallAlg]:
+        if self.solver.solve():
+            solution = self.alg.solution()
+            print(solution)
+            return solution
+        else:
+            print("Algebra not solvable")
+            return None
+
+
+def find_algebra(size: int, gens: Tuple[int, int, int], arity: int, multi_steps: List[List[List[int]]]) -> Optional[SmallAlg]:
+    finder = AlgebraFinder(size, gens, arity)
+    for steps in multi_steps:
+        finder.add_steps(steps)
+    return finder.solve()
+
+
+def _solve_one(item: Tuple[int, Tuple[int, int, int], int, List[List[List[int]]]]) -> Optional[List[Optional[int]]]:
+    alg = find_algebra(*item)
+    if alg is None:
         return None
+    return alg.operations[0].decode()
+
+
+def sweep(items: List[Tuple[int, Tuple[int, int, int], int, List[List[List[int]]]]]) -> List[Optional[SmallAlg]]:
+    """
+    Runs find_algebra on each of the given argument tuples in a separate
+    process. Only the decoded operation tables are sent back, since the
+    solvers cannot be shared between processes.
+    """
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        tables = list(executor.map(_solve_one, items, chunksize=1))
+
+    result = []
+    for (size, gens, arity, _), table in zip(items, tables):
+        if table is None:
+            result.append(None)
+        else:
+            result.append(SmallAlg([
+                Operation(size, arity, table),
+                Constant.constant(size, gens[0]),
+                Constant.constant(size, gens[1]),
+                Constant.constant(size, gens[2]),
+            ]))
+    return result
+
+
+# the constants are shared by all algebras below
+CONST2 = [Constant.constant(2, i) for i in range(2)]
+CONST3 = [Constant.constant(3, i) for i in range(3)]
+
+
+@functools.lru_cache(maxsize=None)
+def algs4() -> List[SmallAlg]:
+    return [
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 2, 0, 0, 1, 0, 1, 1, 2, 2, 2, 0, 2, 2, 2, 1, 2, 2, 2, 2, 0, 0, 0, 0, 1, 1, 1, 2, 0, 0, 1,
+                             0, 1, 1, 1, 1, 1, 2, 0, 1, 2, 1, 1, 0, 0, 1, 2, 0, 2, 1, 1, 1, 0, 2, 1, 2, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 2, 2, 1, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 2, 0, 2, 1, 0, 1, 2, 2, 0, 2, 0, 2, 2, 2, 1, 1, 0, 1, 2, 1, 1,
+                             2, 1, 1, 1, 0, 1, 0, 1, 1, 2, 1, 1, 1, 2, 1, 2, 0, 1, 2, 0, 2, 0, 2, 2, 2, 1, 2, 2, 1, 1, 1, 0, 0, 2, 1, 1, 2, 0, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 0, 2, 2, 1, 2, 0, 2, 2, 0, 0, 0, 1, 0, 2, 2, 1, 2, 0, 2, 1, 1, 1, 1, 2, 1, 0, 1, 1,
+                             2, 1, 1, 1, 0, 1, 0, 0, 2, 1, 1, 1, 1, 1, 1, 2, 0, 0, 1, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 0, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 1, 0, 0, 2, 0, 1, 0, 0, 1, 0, 0, 2, 0, 0, 0, 2, 0, 1, 2, 0, 2, 1, 2, 1, 1, 1, 1, 2, 2, 1,
+                             0, 1, 1, 1, 1, 1, 1, 0, 2, 1, 2, 1, 1, 1, 2, 2, 0, 1, 2, 2, 1, 0, 1, 0, 2, 0, 1, 1, 0, 1, 2, 2, 0, 2, 0, 0, 2, 2, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 1, 0, 2, 2, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 2, 1, 2, 2, 2, 2, 2, 0, 0, 2, 2, 1, 0, 2, 1, 1, 0, 1,
+                             0, 1, 1, 1, 2, 1, 0, 0, 2, 2, 1, 1, 2, 1, 1, 2, 0, 0, 2, 0, 2, 0, 0, 1, 2, 2, 0, 1, 0, 1, 2, 2, 1, 2, 1, 0, 2, 2, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2, 2, 1, 1, 2, 2, 0, 0, 0, 1, 1, 2, 0, 0, 0, 0, 2, 0, 1, 2, 2, 1, 0, 1, 2, 1, 2, 1,
+                             2, 1, 1, 1, 2, 1, 1, 2, 0, 0, 1, 1, 1, 1, 1, 2, 0, 0, 0, 1, 0, 1, 2, 0, 2, 1, 2, 2, 2, 1, 2, 0, 2, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 1, 2, 0, 0, 0, 2, 1, 1, 2, 2, 2, 0, 0, 1, 1, 1, 1, 0, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 1, 0, 1,
+                             2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 1, 2, 2, 2, 2, 1, 2, 0, 1, 1, 2, 2, 0, 2, 2, 0, 2, 1, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 2, 0, 0, 2, 2, 2, 1, 1, 0, 1, 1, 0, 0, 2, 2, 2, 2, 0, 0, 2, 0, 0, 2, 0, 1, 0, 2, 0, 2, 2, 1,
+                             2, 1, 1, 1, 2, 1, 0, 0, 1, 1, 2, 1, 2, 0, 2, 2, 0, 2, 0, 2, 1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 0, 0, 2, 0, 1, 2, 0, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 2, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 2, 0, 2, 2, 1, 1, 0, 0, 0, 1, 1, 1,
+                             2, 1, 1, 1, 1, 1, 0, 1, 0, 2, 2, 1, 1, 2, 0, 2, 0, 2, 1, 2, 1, 0, 1, 0, 2, 0, 0, 1, 1, 1, 1, 2, 2, 2, 0, 0, 2, 1, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 0, 2, 0, 2, 1, 1, 1, 1, 0, 0, 2, 0, 1, 0, 0, 1, 2, 0, 1, 2, 0, 2, 0, 2, 1, 2, 0, 2, 0, 1, 1,
+                             2, 1, 1, 1, 2, 1, 2, 1, 0, 2, 0, 1, 1, 2, 2, 2, 0, 1, 0, 1, 0, 1, 1, 0, 2, 0, 1, 0, 2, 1, 1, 2, 1, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 1, 2, 0, 0, 0, 0, 1, 1, 2, 2, 1, 0, 0, 0, 2, 1, 0, 0, 2, 2, 0, 2, 2, 2, 1, 2, 1, 0, 2, 0, 1,
+                             1, 1, 1, 1, 0, 1, 1, 2, 0, 2, 0, 1, 0, 1, 1, 2, 0, 1, 0, 2, 2, 1, 1, 1, 2, 2, 1, 1, 2, 1, 0, 1, 1, 2, 2, 0, 2, 1, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 2, 0, 0, 2, 0, 2, 1, 2, 1, 2, 0, 0, 2, 0, 0, 1, 1, 2, 1, 2, 0, 0, 2, 1, 1, 2, 0, 0, 0, 2, 1,
+                             2, 1, 1, 1, 2, 1, 0, 2, 1, 1, 1, 1, 1, 0, 1, 2, 0, 2, 2, 2, 0, 1, 1, 2, 2, 0, 0, 1, 0, 1, 1, 1, 2, 2, 1, 0, 2, 1, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 2, 1, 0, 1, 0, 1, 1, 1, 2, 0, 2, 0, 2, 1, 2, 2, 0, 0, 0, 2, 0, 2, 1, 2, 1, 2, 0, 1, 0, 2, 1,
+                             0, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 0, 2, 2, 2, 2, 0, 0, 2, 2, 0, 0, 1, 1, 1, 0, 0, 1, 2, 0, 0, 2, 1, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 2, 2, 1, 0, 0, 0, 1, 0, 0, 1, 2, 1, 2, 1, 0, 2, 0, 0, 1, 0, 1, 1, 1, 2, 1, 2, 1,
+                             0, 1, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1, 0, 2, 0, 2, 0, 2, 0, 0, 1, 1, 2, 2, 2, 0, 2, 2, 2, 1, 1, 0, 0, 2, 0, 2, 2, 0, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 0, 2, 0, 2, 2, 0, 1, 2, 1, 0, 1, 0, 2, 2, 1, 2, 0, 2, 1, 2, 0, 0, 2, 2, 1, 1, 2, 2, 2, 0, 1,
+                             2, 1, 1, 1, 2, 1, 2, 0, 1, 1, 1, 1, 0, 1, 1, 2, 0, 2, 1, 2, 2, 0, 1, 1, 2, 0, 1, 0, 1, 1, 0, 0, 0, 2, 2, 0, 2, 1, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 2, 2, 0, 2, 1, 1, 1, 2, 2, 2, 1, 0, 0, 2, 0, 2, 2, 1, 1, 2, 0, 2, 1, 0, 1, 1, 0, 2, 2, 1, 1,
+                             1, 1, 1, 1, 2, 1, 2, 0, 2, 1, 2, 1, 0, 1, 2, 2, 0, 0, 0, 2, 2, 2, 0, 0, 2, 0, 2, 0, 1, 1, 0, 1, 1, 2, 1, 0, 2, 0, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+    ]
+
 
+@functools.lru_cache(maxsize=None)
+def algs4b() -> List[SmallAlg]:
+    return [
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[0],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
+            CONST2[0],
+            CONST2[1],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(
+                2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+            CONST2[0],
+            CONST2[0],
+            CONST2[1],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 2, 0, 0, 0, 1, 1, 0, 0, 0, 2, 0, 1, 2, 1, 1, 0, 1, 1, 0, 1, 1,
+                             1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 2, 1, 2, 0, 0, 2, 2, 1, 2, 2, 0, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 1, 2, 0, 1, 2, 1, 1, 2, 0, 0, 2, 0, 1, 2, 2, 0, 0, 2, 1, 2, 0, 0, 2, 0, 1, 2, 2, 0, 0, 0, 1,
+                             1, 1, 1, 1, 0, 1, 0, 1, 2, 0, 0, 1, 2, 1, 2, 2, 0, 0, 2, 0, 2, 1, 0, 1, 2, 1, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 2, 2, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 2, 1, 0, 0, 2, 1, 1, 2, 1, 2, 2, 0, 0, 2, 1, 0, 1, 2, 0, 2, 0, 2, 2, 1, 1, 1, 2, 0, 1, 2, 1,
+                             0, 1, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 1, 1, 1, 2, 0, 1, 2, 0, 1, 0, 2, 1, 2, 2, 0, 2, 0, 1, 0, 0, 0, 2, 2, 0, 2, 0, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 1, 0, 0, 0, 2, 1, 2, 0, 2, 2, 0, 0, 2, 0, 2, 1, 1, 2, 2, 0, 1, 0, 2, 1, 0, 1, 1, 0, 2, 1,
+                             1, 1, 1, 1, 0, 1, 0, 2, 1, 2, 2, 1, 0, 0, 0, 2, 0, 1, 0, 0, 2, 2, 1, 0, 2, 2, 0, 1, 1, 1, 2, 0, 2, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 1, 0, 2, 1, 0, 2, 2, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 1, 2, 0, 1, 2, 0, 1, 0, 2, 1, 1, 0, 1,
+                             0, 1, 1, 1, 0, 1, 1, 0, 0, 0, 2, 1, 0, 2, 0, 2, 0, 2, 2, 2, 2, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 0, 0, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 0, 0, 2, 2, 2, 1, 2, 0, 0, 1, 0, 2, 1, 1, 2, 2, 0, 1, 2, 0, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1,
+                             2, 1, 1, 1, 2, 1, 0, 1, 2, 0, 1, 1, 0, 0, 0, 2, 0, 0, 2, 0, 0, 1, 2, 2, 2, 1, 0, 0, 2, 1, 2, 1, 0, 2, 1, 0, 2, 1, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 2, 0, 0, 0, 0, 1, 1, 1, 1, 0, 2, 0, 2, 0, 2, 2, 0, 0, 1, 2, 0, 0, 0, 2, 1, 2, 0, 2, 2, 0, 1,
+                             2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 2, 0, 0, 1, 1, 1, 1, 1, 0, 2, 2, 0, 0, 2, 1, 0, 0, 1, 2, 1, 2, 2, 0, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 1, 0, 1, 2, 0, 2, 1, 2, 1, 1, 2, 2, 1, 0, 1, 0, 1, 2, 0, 1, 0, 2, 0, 2, 0, 1, 1, 2, 0, 1, 2, 0, 1,
+                             0, 1, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 0, 2, 0, 2, 0, 2, 1, 0, 2, 2, 0, 1, 2, 0, 2, 2, 1, 1, 0, 2, 1, 2, 1, 0, 2, 0, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 1, 2, 2, 2, 1, 0, 1, 0, 2, 0, 0, 1, 2, 2, 0, 0, 1, 1, 1, 2, 2, 1, 1, 1, 1,
+                             2, 1, 1, 1, 1, 1, 0, 2, 0, 2, 2, 1, 1, 1, 2, 2, 0, 1, 1, 0, 0, 1, 2, 1, 2, 2, 1, 2, 2, 1, 0, 0, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 1, 2, 2, 1, 0, 2, 2, 0, 0, 1, 2, 0, 1, 2, 1, 0, 2, 0, 1, 1, 2, 1, 0, 2, 2, 2, 1, 1,
+                             0, 1, 1, 1, 2, 1, 0, 1, 2, 0, 2, 1, 2, 1, 2, 2, 0, 0, 0, 1, 0, 0, 1, 2, 2, 0, 1, 0, 2, 1, 0, 2, 0, 2, 1, 2, 2, 0, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 2, 0, 2, 0, 2, 1, 2, 0, 1, 1, 0, 0, 1, 2, 0, 1, 2, 0, 2, 0, 1, 0, 2, 1, 1, 2, 0, 2, 1, 1,
+                             1, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 0, 0, 1, 2, 0, 0, 2, 1, 2, 1, 0, 1, 2, 1, 1, 1, 0, 1, 1, 2, 2, 2, 0, 0, 2, 2, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 2, 1, 0, 1, 2, 2, 1, 0, 1, 2, 0, 0, 0, 1, 0, 1, 0, 1, 2, 2, 0, 2, 2, 1, 1, 0, 0, 1, 1, 0, 1,
+                             1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 0, 1, 2, 0, 2, 2, 0, 2, 2, 2, 1, 2, 1, 1, 2, 2, 2, 2, 2, 1, 0, 2, 0, 2, 1, 0, 2, 1, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 2, 0, 1, 1, 0, 1, 1, 2, 2, 0, 0, 0, 2, 2, 2, 1, 1, 1, 2, 0, 1, 0, 2, 1, 2, 0, 2, 1, 1, 1,
+                             2, 1, 1, 1, 2, 1, 0, 0, 2, 2, 2, 1, 2, 0, 1, 2, 0, 1, 0, 2, 2, 2, 0, 0, 2, 0, 0, 0, 2, 1, 1, 0, 0, 2, 1, 0, 2, 1, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 2, 1, 0, 1, 1, 0, 1, 0, 0, 0, 2, 1, 1, 2, 2, 1, 2, 0, 2, 1, 2, 1, 2, 1, 2, 2, 2, 1,
+                             1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 0, 1, 0, 2, 0, 2, 1, 0, 0, 2, 1, 1, 2, 0, 2, 0, 1, 1, 0, 0, 0, 2, 0, 0, 2, 0, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 2, 1, 2, 2, 0, 0, 0, 0, 1, 0, 1, 2, 1, 2, 2, 0, 2, 0, 2, 1, 2, 1, 2, 2, 0, 1,
+                             1, 1, 1, 1, 1, 1, 2, 0, 1, 0, 2, 1, 2, 1, 0, 2, 0, 1, 1, 2, 0, 2, 1, 2, 2, 2, 2, 0, 0, 1, 0, 0, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 2, 1, 0, 0, 2, 2, 1, 0, 2, 2, 0, 0, 2, 0, 1, 2, 1, 0, 1, 2, 0, 2, 0, 2, 1, 1, 1, 2, 2, 2, 1,
+                             1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 2, 0, 0, 2, 0, 0, 0, 0, 2, 0, 1, 0, 2, 1, 2, 0, 1, 1, 1, 1, 1, 2, 1, 0, 2, 2, 0, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 1, 0, 1, 2, 2, 1, 1, 1, 1, 0, 0, 0, 1, 2, 1, 2, 0, 0, 2, 0, 0, 2, 2, 1, 2, 2, 1, 2, 2, 1,
+                             0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 2, 2, 0, 2, 0, 2, 0, 2, 2, 2, 1, 0, 2, 0, 1, 1, 1, 1, 1, 1, 0, 2, 0, 2, 2, 2, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 1, 0, 2, 1, 1, 1, 2, 0, 1, 1, 0, 2, 2, 0, 2, 0, 2, 2, 2, 0, 1, 2, 0, 1, 1, 1, 1, 0, 2, 1,
+                             2, 1, 1, 1, 2, 1, 0, 0, 2, 2, 1, 1, 1, 1, 2, 2, 0, 0, 1, 0, 1, 2, 1, 0, 2, 2, 0, 2, 2, 1, 0, 1, 0, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 2, 0, 1, 0, 2, 2, 1, 0, 0, 1, 2, 2, 0, 1, 0, 2, 0, 0, 2, 2, 1, 2, 2, 1, 1, 1, 1,
+                             2, 1, 1, 1, 2, 1, 0, 0, 1, 0, 0, 1, 1, 1, 2, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 0, 2, 1, 1, 1, 2, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+        SmallAlg([
+            Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 1, 0, 0, 1, 2, 1, 1, 1, 1, 1, 0, 2, 1, 2, 1, 1, 1, 1, 2, 0, 0, 0, 2, 1, 1, 0, 2, 0, 2, 1,
+                             2, 1, 1, 1, 1, 1, 2, 1, 0, 0, 2, 1, 0, 2, 1, 2, 0, 2, 0, 2, 2, 1, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 1, 2, 2, 0, 2, 0, 1, 2, 2, 2, 2]),
+            CONST3[0],
+            CONST3[1],
+            CONST3[2],
+        ]),
+    ]
 
-ALGS4 = [
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 2, 0, 0, 1, 0, 1, 1, 2, 2, 2, 0, 2, 2, 2, 1, 2, 2, 2, 2, 0, 0, 0, 0, 1, 1, 1, 2, 0, 0, 1,
-                         0, 1, 1, 1, 1, 1, 2, 0, 1, 2, 1, 1, 0, 0, 1, 2, 0, 2, 1, 1, 1, 0, 2, 1, 2, 0, 1, 1, 1, 1, 1, 0, 1, 2, 1, 2, 2, 1, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 2, 0, 2, 1, 0, 1, 2, 2, 0, 2, 0, 2, 2, 2, 1, 1, 0, 1, 2, 1, 1,
-                         2, 1, 1, 1, 0, 1, 0, 1, 1, 2, 1, 1, 1, 2, 1, 2, 0, 1, 2, 0, 2, 0, 2, 2, 2, 1, 2, 2, 1, 1, 1, 0, 0, 2, 1, 1, 2, 0, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 0, 2, 2, 1, 2, 0, 2, 2, 0, 0, 0, 1, 0, 2, 2, 1, 2, 0, 2, 1, 1, 1, 1, 2, 1, 0, 1, 1,
-                         2, 1, 1, 1, 0, 1, 0, 0, 2, 1, 1, 1, 1, 1, 1, 2, 0, 0, 1, 2, 1, 2, 2, 1, 2, 2, 1, 2, 2, 1, 0, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 1, 0, 0, 2, 0, 1, 0, 0, 1, 0, 0, 2, 0, 0, 0, 2, 0, 1, 2, 0, 2, 1, 2, 1, 1, 1, 1, 2, 2, 1,
-                         0, 1, 1, 1, 1, 1, 1, 0, 2, 1, 2, 1, 1, 1, 2, 2, 0, 1, 2, 2, 1, 0, 1, 0, 2, 0, 1, 1, 0, 1, 2, 2, 0, 2, 0, 0, 2, 2, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 1, 0, 2, 2, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 2, 1, 2, 2, 2, 2, 2, 0, 0, 2, 2, 1, 0, 2, 1, 1, 0, 1,
-                         0, 1, 1, 1, 2, 1, 0, 0, 2, 2, 1, 1, 2, 1, 1, 2, 0, 0, 2, 0, 2, 0, 0, 1, 2, 2, 0, 1, 0, 1, 2, 2, 1, 2, 1, 0, 2, 2, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2, 2, 1, 1, 2, 2, 0, 0, 0, 1, 1, 2, 0, 0, 0, 0, 2, 0, 1, 2, 2, 1, 0, 1, 2, 1, 2, 1,
-                         2, 1, 1, 1, 2, 1, 1, 2, 0, 0, 1, 1, 1, 1, 1, 2, 0, 0, 0, 1, 0, 1, 2, 0, 2, 1, 2, 2, 2, 1, 2, 0, 2, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 1, 2, 0, 0, 0, 2, 1, 1, 2, 2, 2, 0, 0, 1, 1, 1, 1, 0, 2, 2, 0, 0, 0, 1, 1, 1, 2, 2, 1, 0, 1,
-                         2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 1, 2, 2, 2, 2, 1, 2, 0, 1, 1, 2, 2, 0, 2, 2, 0, 2, 1, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 2, 0, 0, 2, 2, 2, 1, 1, 0, 1, 1, 0, 0, 2, 2, 2, 2, 0, 0, 2, 0, 0, 2, 0, 1, 0, 2, 0, 2, 2, 1,
-                         2, 1, 1, 1, 2, 1, 0, 0, 1, 1, 2, 1, 2, 0, 2, 2, 0, 2, 0, 2, 1, 1, 1, 1, 2, 1, 0, 1, 1, 1, 1, 0, 0, 2, 0, 1, 2, 0, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, 2, 0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 2, 0, 2, 2, 1, 1, 0, 0, 0, 1, 1, 1,
-                         2, 1, 1, 1, 1, 1, 0, 1, 0, 2, 2, 1, 1, 2, 0, 2, 0, 2, 1, 2, 1, 0, 1, 0, 2, 0, 0, 1, 1, 1, 1, 2, 2, 2, 0, 0, 2, 1, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 0, 2, 0, 2, 1, 1, 1, 1, 0, 0, 2, 0, 1, 0, 0, 1, 2, 0, 1, 2, 0, 2, 0, 2, 1, 2, 0, 2, 0, 1, 1,
-                         2, 1, 1, 1, 2, 1, 2, 1, 0, 2, 0, 1, 1, 2, 2, 2, 0, 1, 0, 1, 0, 1, 1, 0, 2, 0, 1, 0, 2, 1, 1, 2, 1, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 1, 2, 0, 0, 0, 0, 1, 1, 2, 2, 1, 0, 0, 0, 2, 1, 0, 0, 2, 2, 0, 2, 2, 2, 1, 2, 1, 0, 2, 0, 1,
-                         1, 1, 1, 1, 0, 1, 1, 2, 0, 2, 0, 1, 0, 1, 1, 2, 0, 1, 0, 2, 2, 1, 1, 1, 2, 2, 1, 1, 2, 1, 0, 1, 1, 2, 2, 0, 2, 1, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 2, 0, 0, 2, 0, 2, 1, 2, 1, 2, 0, 0, 2, 0, 0, 1, 1, 2, 1, 2, 0, 0, 2, 1, 1, 2, 0, 0, 0, 2, 1,
-                         2, 1, 1, 1, 2, 1, 0, 2, 1, 1, 1, 1, 1, 0, 1, 2, 0, 2, 2, 2, 0, 1, 1, 2, 2, 0, 0, 1, 0, 1, 1, 1, 2, 2, 1, 0, 2, 1, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 2, 1, 0, 1, 0, 1, 1, 1, 2, 0, 2, 0, 2, 1, 2, 2, 0, 0, 0, 2, 0, 2, 1, 2, 1, 2, 0, 1, 0, 2, 1,
-                         0, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 0, 2, 2, 2, 2, 0, 0, 2, 2, 0, 0, 1, 1, 1, 0, 0, 1, 2, 0, 0, 2, 1, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 2, 2, 1, 0, 0, 0, 1, 0, 0, 1, 2, 1, 2, 1, 0, 2, 0, 0, 1, 0, 1, 1, 1, 2, 1, 2, 1,
-                         0, 1, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1, 0, 2, 0, 2, 0, 2, 0, 0, 1, 1, 2, 2, 2, 0, 2, 2, 2, 1, 1, 0, 0, 2, 0, 2, 2, 0, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 0, 2, 0, 2, 2, 0, 1, 2, 1, 0, 1, 0, 2, 2, 1, 2, 0, 2, 1, 2, 0, 0, 2, 2, 1, 1, 2, 2, 2, 0, 1,
-                         2, 1, 1, 1, 2, 1, 2, 0, 1, 1, 1, 1, 0, 1, 1, 2, 0, 2, 1, 2, 2, 0, 1, 1, 2, 0, 1, 0, 1, 1, 0, 0, 0, 2, 2, 0, 2, 1, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 2, 2, 0, 2, 1, 1, 1, 2, 2, 2, 1, 0, 0, 2, 0, 2, 2, 1, 1, 2, 0, 2, 1, 0, 1, 1, 0, 2, 2, 1, 1,
-                         1, 1, 1, 1, 2, 1, 2, 0, 2, 1, 2, 1, 0, 1, 2, 2, 0, 0, 0, 2, 2, 2, 0, 0, 2, 0, 2, 0, 1, 1, 0, 1, 1, 2, 1, 0, 2, 0, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-]
-
-
-ALGS4B = [
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [0]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 1, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(
-            2, 4, [0, 0, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [0]),
-        Operation(2, 0, [1]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 0, 2, 0, 0, 0, 1, 1, 0, 0, 0, 2, 0, 1, 2, 1, 1, 0, 1, 1, 0, 1, 1,
-                         1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 2, 1, 2, 0, 0, 2, 2, 1, 2, 2, 0, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 2, 0, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 1, 2, 0, 1, 2, 1, 1, 2, 0, 0, 2, 0, 1, 2, 2, 0, 0, 2, 1, 2, 0, 0, 2, 0, 1, 2, 2, 0, 0, 0, 1,
-                         1, 1, 1, 1, 0, 1, 0, 1, 2, 0, 0, 1, 2, 1, 2, 2, 0, 0, 2, 0, 2, 1, 0, 1, 2, 1, 1, 1, 1, 1, 1, 0, 1, 2, 1, 1, 2, 2, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 2, 1, 0, 0, 2, 1, 1, 2, 1, 2, 2, 0, 0, 2, 1, 0, 1, 2, 0, 2, 0, 2, 2, 1, 1, 1, 2, 0, 1, 2, 1,
-                         0, 1, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 1, 1, 1, 2, 0, 1, 2, 0, 1, 0, 2, 1, 2, 2, 0, 2, 0, 1, 0, 0, 0, 2, 2, 0, 2, 0, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 1, 0, 0, 0, 2, 1, 2, 0, 2, 2, 0, 0, 2, 0, 2, 1, 1, 2, 2, 0, 1, 0, 2, 1, 0, 1, 1, 0, 2, 1,
-                         1, 1, 1, 1, 0, 1, 0, 2, 1, 2, 2, 1, 0, 0, 0, 2, 0, 1, 0, 0, 2, 2, 1, 0, 2, 2, 0, 1, 1, 1, 2, 0, 2, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 1, 0, 2, 1, 0, 2, 2, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 0, 1, 1, 2, 0, 1, 2, 0, 1, 0, 2, 1, 1, 0, 1,
-                         0, 1, 1, 1, 0, 1, 1, 0, 0, 0, 2, 1, 0, 2, 0, 2, 0, 2, 2, 2, 2, 2, 0, 1, 2, 2, 1, 2, 2, 1, 2, 0, 0, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 0, 0, 2, 2, 2, 1, 2, 0, 0, 1, 0, 2, 1, 1, 2, 2, 0, 1, 2, 0, 1, 1, 2, 1, 2, 2, 1, 0, 1, 1,
-                         2, 1, 1, 1, 2, 1, 0, 1, 2, 0, 1, 1, 0, 0, 0, 2, 0, 0, 2, 0, 0, 1, 2, 2, 2, 1, 0, 0, 2, 1, 2, 1, 0, 2, 1, 0, 2, 1, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 2, 0, 2, 0, 0, 0, 0, 1, 1, 1, 1, 0, 2, 0, 2, 0, 2, 2, 0, 0, 1, 2, 0, 0, 0, 2, 1, 2, 0, 2, 2, 0, 1,
-                         2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 2, 0, 0, 1, 1, 1, 1, 1, 0, 2, 2, 0, 0, 2, 1, 0, 0, 1, 2, 1, 2, 2, 0, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 1, 0, 1, 2, 0, 2, 1, 2, 1, 1, 2, 2, 1, 0, 1, 0, 1, 2, 0, 1, 0, 2, 0, 2, 0, 1, 1, 2, 0, 1, 2, 0, 1,
-                         0, 1, 1, 1, 2, 1, 2, 2, 0, 0, 1, 1, 0, 2, 0, 2, 0, 2, 1, 0, 2, 2, 0, 1, 2, 0, 2, 2, 1, 1, 0, 2, 1, 2, 1, 0, 2, 0, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 1, 2, 2, 2, 1, 0, 1, 0, 2, 0, 0, 1, 2, 2, 0, 0, 1, 1, 1, 2, 2, 1, 1, 1, 1,
-                         2, 1, 1, 1, 1, 1, 0, 2, 0, 2, 2, 1, 1, 1, 2, 2, 0, 1, 1, 0, 0, 1, 2, 1, 2, 2, 1, 2, 2, 1, 0, 0, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 0, 0, 1, 2, 2, 1, 0, 2, 2, 0, 0, 1, 2, 0, 1, 2, 1, 0, 2, 0, 1, 1, 2, 1, 0, 2, 2, 2, 1, 1,
-                         0, 1, 1, 1, 2, 1, 0, 1, 2, 0, 2, 1, 2, 1, 2, 2, 0, 0, 0, 1, 0, 0, 1, 2, 2, 0, 1, 0, 2, 1, 0, 2, 0, 2, 1, 2, 2, 0, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 1, 2, 0, 2, 0, 2, 1, 2, 0, 1, 1, 0, 0, 1, 2, 0, 1, 2, 0, 2, 0, 1, 0, 2, 1, 1, 2, 0, 2, 1, 1,
-                         1, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 0, 0, 1, 2, 0, 0, 2, 1, 2, 1, 0, 1, 2, 1, 1, 1, 0, 1, 1, 2, 2, 2, 0, 0, 2, 2, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 2, 0, 2, 1, 0, 1, 2, 2, 1, 0, 1, 2, 0, 0, 0, 1, 0, 1, 0, 1, 2, 2, 0, 2, 2, 1, 1, 0, 0, 1, 1, 0, 1,
-                         1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 0, 1, 2, 0, 2, 2, 0, 2, 2, 2, 1, 2, 1, 1, 2, 2, 2, 2, 2, 1, 0, 2, 0, 2, 1, 0, 2, 1, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 2, 0, 1, 1, 0, 1, 1, 2, 2, 0, 0, 0, 2, 2, 2, 1, 1, 1, 2, 0, 1, 0, 2, 1, 2, 0, 2, 1, 1, 1,
-                         2, 1, 1, 1, 2, 1, 0, 0, 2, 2, 2, 1, 2, 0, 1, 2, 0, 1, 0, 2, 2, 2, 0, 0, 2, 0, 0, 0, 2, 1, 1, 0, 0, 2, 1, 0, 2, 1, 0, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 2, 1, 0, 1, 1, 0, 1, 0, 0, 0, 2, 1, 1, 2, 2, 1, 2, 0, 2, 1, 2, 1, 2, 1, 2, 2, 2, 1,
-                         1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 0, 1, 0, 2, 0, 2, 1, 0, 0, 2, 1, 1, 2, 0, 2, 0, 1, 1, 0, 0, 0, 2, 0, 0, 2, 0, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 2, 1, 2, 2, 0, 0, 0, 0, 1, 0, 1, 2, 1, 2, 2, 0, 2, 0, 2, 1, 2, 1, 2, 2, 0, 1,
-                         1, 1, 1, 1, 1, 1, 2, 0, 1, 0, 2, 1, 2, 1, 0, 2, 0, 1, 1, 2, 0, 2, 1, 2, 2, 2, 2, 0, 0, 1, 0, 0, 1, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2]),
-        Operation(3, 0, [0]),
-        Operation(3, 0, [1]),
-        Operation(3, 0, [2]),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 0, 0, 0, 2, 1, 0, 0, 2, 2, 1, 0, 2, 2, 0, 0, 2, 0, 1, 2, 1, 0, 1, 2, 0, 2, 0, 2, 1, 1, 1, 2, 2, 2, 1,
-                         1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 2, 0, 0, 2, 0, 0, 0, 0, 2, 0, 1, 0, 2, 1, 2, 0, 1, 1, 1, 1, 1, 2, 1, 0, 2, 2, 0, 2, 2, 2, 2]),
-        Constant(3, 0),
-        Constant(3, 1),
-        Constant(3, 2),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 2, 1, 0, 1, 2, 2, 1, 1, 1, 1, 0, 0, 0, 1, 2, 1, 2, 0, 0, 2, 0, 0, 2, 2, 1, 2, 2, 1, 2, 2, 1,
-                         0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 2, 2, 0, 2, 0, 2, 0, 2, 2, 2, 1, 0, 2, 0, 1, 1, 1, 1, 1, 1, 0, 2, 0, 2, 2, 2, 1, 2, 2, 2, 2]),
-        Constant(3, 0),
-        Constant(3, 1),
-        Constant(3, 2),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 0, 0, 0, 1, 0, 2, 1, 1, 1, 2, 0, 1, 1, 0, 2, 2, 0, 2, 0, 2, 2, 2, 0, 1, 2, 0, 1, 1, 1, 1, 0, 2, 1,
-                         2, 1, 1, 1, 2, 1, 0, 0, 2, 2, 1, 1, 1, 1, 2, 2, 0, 0, 1, 0, 1, 2, 1, 0, 2, 2, 0, 2, 2, 1, 0, 1, 0, 2, 0, 1, 2, 0, 1, 2, 2, 2, 2]),
-        Constant(3, 0),
-        Constant(3, 1),
-        Constant(3, 2),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 2, 0, 1, 0, 2, 2, 1, 0, 0, 1, 2, 2, 0, 1, 0, 2, 0, 0, 2, 2, 1, 2, 2, 1, 1, 1, 1,
-                         2, 1, 1, 1, 2, 1, 0, 0, 1, 0, 0, 1, 1, 1, 2, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 0, 2, 1, 1, 1, 2, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]),
-        Constant(3, 0),
-        Constant(3, 1),
-        Constant(3, 2),
-    ]),
-    SmallAlg([
-        Operation(3, 4, [0, 0, 0, 0, 2, 2, 0, 0, 1, 0, 0, 1, 2, 1, 1, 1, 1, 1, 0, 2, 1, 2, 1, 1, 1, 1, 2, 0, 0, 0, 2, 1, 1, 0, 2, 0, 2, 1,
-                         2, 1, 1, 1, 1, 1, 2, 1, 0, 0, 2, 1, 0, 2, 1, 2, 0, 2, 0, 2, 2, 1, 2, 2, 2, 2, 0, 2, 2, 1, 2, 2, 1, 2, 2, 0, 2, 0, 1, 2, 2, 2, 2]),
-        Constant(3, 0),
-        Constant(3, 1),
-        Constant(3, 2),
-    ]),
-]
+
+def __getattr__(name: str) -> Any:
+    # the algebra lists are only built when first used
+    if name == 'ALGS4':
+        return algs4()
+    elif name == 'ALGS4B':
+        return algs4b()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def test0():
@@ -891,21 +1070,34 @@ def test0():
 
 
 def test1():
-    algs = list(ALGS4B)
+    algs = list(algs4b())
     arity = 4
     num_steps = 6
 
+    gen = Generator(arity, algs)
+    for _ in range(num_steps):
+        gen.add_step()
+    gen.final_loop()
+
     next_alg = None
-    multi_steps = []
+    finder = AlgebraFinder(3, (0, 1, 2), arity)
     while True:
-        steps = find_term(arity,
-                          algs + [next_alg] if next_alg else algs,
-                          num_steps)
-        if not steps:
+        # the term constraints of the last algebra are only assumed
+        guards = []
+        if next_alg is not None:
+            guards.append(gen.solver.add_variable())
+            gen.add_algebra(next_alg, guards[0])
+
+        if not gen.solver.solve_with(guards):
+            print("Term not solvable")
             break
 
-        multi_steps.append(steps)
-        alg = find_algebra(3, (0, 1, 2), arity, multi_steps)
+        steps = gen.decode()
+        for guard in guards:
+            gen.solver.add_clause1(Solver.bool_not(guard))
+
+        finder.add_steps(steps)
+        alg = finder.solve()
         if alg is None:
             break
 
@@ -926,7 +1118,7 @@ def test2():
     find_algebra(8, (0, 1, 2), 3, [steps])
 
 
-def test3():
+def test3(probe: bool = False):
     size = 10
     arity = 4
     depth = 3
@@ -934,21 +1126,26 @@ def test3():
     solver = Solver()
     oper = Operation.variable(size, arity, solver)
 
-    for idx in range(arity):
-        new_vars = [0] * idx + [1] + [0] * (arity - idx - 1)
-        (~oper.polymer(new_vars).table
-            ^ Operation.projection(size, 2, 0).table).ensure_all()
+    proj = Operation.projection(size, 2, 0).table
+    BitVec.concat([
+        oper.polymer([0] * idx + [1] + [0] * (arity - idx - 1)).table
+        for idx in range(arity)
+    ]).ensure_eq(BitVec.concat([proj] * arity))
 
-    rel = Relation.singleton(size, [0, 1])
-    rel |= Relation.singleton(size, [1, 2])
-    rel |= Relation.singleton(size, [1, 0])
-    rel |= Relation.singleton(size, [2, 0])
+    rel = Relation.tuples(size, 2, [[0, 1], [1, 2], [1, 0], [2, 0]])
 
     rels = [rel]
     for _ in range(depth):
         rel |= oper.apply(rel)
         rels.append(rel)
 
+        # optionally probe each depth under an assumption, reusing the
+        # same solver, at the cost of one extra solve per depth
+        if probe:
+            noloop = (~rel.polymer([0, 0]).table).fold_all()[0]
+            print(f"Depth {len(rels) - 1} avoids loop:",
+                  solver.solve_with([noloop]))
+
     rel = rel.polymer([0, 0])
     (~rel.table).ensure_all()
 
@@ -960,5 +1157,17 @@ def test3():
         print("Not solvable")
 
 
+def test4():
+    items = [(size, gens, 4, [])
+             for size in [2, 3]
+             for gens in itertools.product(range(size), repeat=3)]
+    for alg in sweep(items):
+        print(alg)
+
+
+def test5():
+    print(find_term_parallel(4, algs4b(), [4, 5, 6, 7]))
+
+
 if __name__ == '__main__':
     test1()
@@ -13,9 +13,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import numpy
 from uasat import BitVec, Solver, Relation, Operation
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def enlarge_positions(size: int, arity: int, depth: int) -> Tuple[int, ...]:
+    # every block of size many literals is repeated arity many times
+    positions = []
+    for start in range(0, size * arity ** depth, size):
+        block = range(start, start + size)
+        for _ in range(arity):
+            positions.extend(block)
+    return tuple(positions)
 
 
 class Term:
@@ -40,25 +52,19 @@ class Term:
     def variable(size: int, arity: int, depth: int, solver: Solver) -> 'Term':
         assert size >= 1 and arity >= 3 and depth >= 0
         table = BitVec.variable(solver, size * (arity ** depth))
-        for start in range(0, len(table), size):
-            table.slice(start, start + size).ensure_one()
+        table.ensure_one(size)
         return Term(size, arity, depth, table)
 
     def solution(self) -> 'Term':
         return Term(self.size, self.arity, self.depth, self.table.solution())
 
     def decode(self) -> numpy.ndarray:
-        result = numpy.empty([self.arity ** self.depth], dtype=int)
-
-        table = self.table.solution()
-        for i in range(len(result)):
-            for j in range(self.size):
-                if table[i * self.size + j] == Solver.TRUE:
-                    result[i] = j
-                    break
-            else:
-                raise ValueError()
+        table = numpy.array(self.table.solution().literals) == Solver.TRUE
+        table = table.reshape([self.arity ** self.depth, self.size])
+        if not table.any(axis=1).all():
+            raise ValueError()
 
+        result = table.argmax(axis=1)
         return result.reshape([self.arity for _ in range(self.depth)])
 
     def subterms(self) -> List['Term']:
@@ -87,13 +93,9 @@ class Term:
         return Term(size, arity, depth + 1, BitVec(solver, literals))
 
     def enlarge(self) -> 'Term':
-        literals = self.table.literals
-        enlarged = []
-        for start in range(0, len(literals), self.size):
-            for _ in range(self.arity):
-                enlarged.extend(literals[start:start + self.size])
+        positions = enlarge_positions(self.size, self.arity, self.depth)
         return Term(self.size, self.arity, self.depth + 1,
-                    BitVec(self.table.solver, enlarged))
+                    self.table.gather(positions))
 
     @staticmethod
     def choice(selector: BitVec, choices: List['Term']) -> 'Term':
@@ -102,33 +104,30 @@ class Term:
         size = choices[0].size
         arity = choices[0].arity
         depth = choices[0].depth
-        solver = Solver.CALC
         for c in choices:
-            solver |= c.table.solver
             assert c.size == size and c.arity == arity and c.depth == depth
 
-        literals = []
-        for i in range(len(choices[0].table)):
-            values = BitVec(solver, [c.table[i] for c in choices])
-            values &= selector
-            literals.append(values.fold_any()[0])
-
-        table = BitVec(solver, literals)
-        for i in range(0, len(table), size):
-            table.slice(i, i + size).ensure_one()
+        # the rows are and-ed with the selector and or-ed in a single pass
+        rows = BitVec.concat([c.table for c in choices])
+        solver = selector.solver | rows.solver
+        table = BitVec(solver, solver.fold_choice(
+            selector.literals, rows.literals))
+        table.ensure_one(size)
 
         return Term(size, arity, depth, table)
 
-    def rewrite(self) -> 'Term':
+    def rewrite(self, cache: Optional[Dict[Tuple[int, ...], 'Term']] = None) -> 'Term':
         if self.depth == 0:
             return self
 
-        subterms = [s.rewrite() for s in self.subterms()]
-        assert len(subterms) == self.arity and self.arity >= 3
+        # the cache is keyed by the literals, so it is only valid within
+        # a single solver
+        key = tuple(self.table.literals) if cache is not None else ()
+        if cache is not None and key in cache:
+            return cache[key]
 
-        option0 = subterms[0].enlarge()
-        option1 = subterms[1].enlarge()
-        option2 = Term.combine(subterms)
+        subterms = [s.rewrite(cache) for s in self.subterms()]
+        assert len(subterms) == self.arity and self.arity >= 3
 
         equalities = []
         for i in range(self.arity):
@@ -136,35 +135,55 @@ class Term:
             b = subterms[(i + 1) % self.arity].table
             equalities.append(a.comp_eq(b))
 
-        test0 = BitVec(Solver.CALC, [Solver.FALSE])
-        test1 = test0
-        for i in range(self.arity):
-            t = BitVec(Solver.CALC, [Solver.TRUE])
-            for j in range(self.arity - 2):
-                t &= equalities[(i + j) % self.arity]
-            if i == 1:
-                test1 = t & ~equalities[0]
-            else:
-                test0 |= t
+        # each window of arity - 2 cyclically consecutive equalities is
+        # folded in one call, the doubled list avoids the wrap around
+        eq2 = equalities + equalities
+        windows = [BitVec.concat(eq2[i:i + self.arity - 2]).fold_all()
+                   for i in range(self.arity)]
+        test0 = BitVec.concat(windows[:1] + windows[2:]).fold_any()
+        test1 = windows[1] & ~equalities[0]
         test2 = ~test0 & ~test1
 
         selector = BitVec(self.table.solver, [test0[0], test1[0], test2[0]])
         selector.ensure_one()
-        return Term.choice(selector, [option0, option1, option2])
+
+        # equal subterm literals fold the tests to constants, then only the
+        # selected option is built and no choice circuit is needed
+        if selector[0] == Solver.TRUE:
+            result = subterms[0].enlarge()
+        elif selector[1] == Solver.TRUE:
+            result = subterms[1].enlarge()
+        elif selector[2] == Solver.TRUE:
+            result = Term.combine(subterms)
+        else:
+            option0 = subterms[0].enlarge()
+            option1 = subterms[1].enlarge()
+            option2 = Term.combine(subterms)
+            result = Term.choice(selector, [option0, option1, option2])
+        if cache is not None:
+            cache[key] = result
+        return result
 
 
 def ensure_generators(relation: Relation, terms: List[Term]):
     assert relation.arity == len(terms) and len(terms) >= 1
     assert all(relation.size == t.size for t in terms)
 
-    tables = [t.table for t in terms]
-    for start in range(0, len(tables[0]), relation.size):
-        rel = relation
-        for i, t in enumerate(tables):
-            r = Relation(relation.size, 1, t.slice(
-                start, start + relation.size))
-            rel &= r.polymer([i], relation.arity)
-        rel.ensure_any()
+    # all slices are checked against the relation at once: for each slice
+    # and relation position the coordinates are gathered from the tables
+    size = relation.size
+    length = relation.length
+    count = len(terms[0].table) // size
+    assert all(len(t.table) == count * size for t in terms)
+
+    table = relation.table.gather(
+        [pos for _ in range(count) for pos in range(length)])
+    for i, t in enumerate(terms):
+        table &= t.table.gather(
+            [start + (pos // size ** i) % size
+             for start in range(0, count * size, size)
+             for pos in range(length)])
+    table.fold_any(length).ensure_all()
 
 
 class Lookup:
@@ -172,27 +191,33 @@ class Lookup:
         assert depth >= 0
         self.depth = depth
         self.terms: List[Term] = []
+        # the terms are calculator tables, so equal literals mean equal
+        # terms, and shallower terms are remembered before enlargement
+        self.index: Dict[Tuple[int, Tuple[int, ...]], int] = {}
 
     def get(self, term: Term, add: bool = False) -> Optional[int]:
         assert not term.table.solver and term.depth <= self.depth
+        key = (term.depth, tuple(term.table.literals))
+        i = self.index.get(key)
+        if i is not None or term.depth == self.depth and not add:
+            return i
+
         while term.depth < self.depth:
             term = term.enlarge()
-
-        for i, t in enumerate(self.terms):
-            len(t.table)
-            assert len(t.table) == len(term.table)
-            if term.table.comp_eq(t.table).value():
-                return i
-
-        return None
-
-    def add(self, term: Term) -> int:
-        i = self.get(term)
+        full = (term.depth, tuple(term.table.literals))
+        i = self.index.get(full)
         if i is None:
+            if not add:
+                return None
             i = len(self.terms)
-            while term.depth < self.depth:
-                term = term.enlarge()
             self.terms.append(term)
+            self.index[full] = i
+        self.index[key] = i
+        return i
+
+    def add(self, term: Term) -> int:
+        i = self.get(term, add=True)
+        assert i is not None
         return i
 
 
@@ -202,6 +227,7 @@ def decode_generation(terms: List[Term]):
         lookup.add(Term.constant(terms[0].size, terms[0].arity, i))
 
     values = set()
+    cache: Dict[Tuple[int, ...], Term] = {}
 
     def decode(terms: List[Term]):
         subterms = []
@@ -210,14 +236,15 @@ def decode_generation(terms: List[Term]):
             for subs in zip(*subterms):
                 decode(subs)  # type: ignore
 
-        value = tuple(lookup.add(t.rewrite()) for t in terms)
+        value = tuple(lookup.add(t.rewrite(cache)) for t in terms)
         if value not in values:
             if terms[0].depth == 0:
                 print(value, "generator")
             else:
                 args = []
                 for sub in zip(*subterms):
-                    args.append(tuple(lookup.get(t.rewrite()) for t in sub))
+                    args.append(tuple(lookup.get(t.rewrite(cache))
+                                      for t in sub))
                 print(value, "apply", args)
 
             values.add(value)
@@ -257,11 +284,13 @@ def find_example6():
 
     solver = Solver()
 
+    # all near-unanimity identities are asserted in a single batch
     oper = Operation.variable(size, arity, solver)
-    for idx in range(arity):
-        new_vars = [0] * idx + [1] + [0] * (arity - idx - 1)
-        oper.polymer(new_vars).comp_eq(
-            Operation.projection(size, 2, 0)).ensure_all()
+    proj = Operation.projection(size, 2, 0).table
+    BitVec.concat([
+        oper.polymer([0] * idx + [1] + [0] * (arity - idx - 1)).table
+        for idx in range(arity)
+    ]).ensure_eq(BitVec.concat([proj] * arity))
 
     rel = Relation.tuples(
         size, 2, [(0, 1), (1, 0), (1, 2), (2, 1), (2, 0), (0, 2)])
@@ -27,6 +27,20 @@ pub struct PyBitVec {
     literals: Box<[i32]>,
 }
 
+impl PyBitVec {
+    /// Splits the literals into consecutive groups of the given length,
+    /// or returns a single group of all literals if no step is given.
+    fn groups(&self, step: Option<usize>) -> PyResult<Vec<&[i32]>> {
+        match step {
+            None => Ok(vec![&self.literals[..]]),
+            Some(step) if step >= 1 && self.literals.len() % step == 0 => {
+                Ok(self.literals.chunks(step).collect())
+            }
+            Some(_) => Err(PyValueError::new_err("invalid step")),
+        }
+    }
+}
+
 #[pymethods]
 impl PyBitVec {
     /// Creates a new bit vector with the associated solver and literals.
@@ -57,6 +71,43 @@ impl PyBitVec {
         }
     }
 
+    /// Constructs a new calculator bit vector that encodes the given list
+    /// of values in one-hot form. Each value occupies size many consecutive
+    /// literals, of which only the one at the position of the value is true.
+    /// Missing values are encoded with all literals false.
+    #[staticmethod]
+    pub fn one_hot(py: Python<'_>, size: usize, values: Vec<Option<usize>>) -> PyResult<Self> {
+        let mut literals = vec![PySolver::FALSE; size * values.len()];
+        for (idx, val) in values.into_iter().enumerate() {
+            if let Some(val) = val {
+                if val >= size {
+                    return Err(PyValueError::new_err("invalid value"));
+                }
+                literals[idx * size + val] = PySolver::TRUE;
+            }
+        }
+
+        let solver = py.get_type::<PySolver>().getattr("CALC")?.extract()?;
+        let literals = literals.into_boxed_slice();
+        Ok(PyBitVec { solver, literals })
+    }
+
+    /// Returns the concatenation of the given bit vectors. The vectors must
+    /// belong to the same solver or to the calculator instance.
+    #[staticmethod]
+    pub fn concat(py: Python<'_>, vectors: Vec<Py<Self>>) -> PyResult<Self> {
+        let mut solver: Py<PySolver> = py.get_type::<PySolver>().getattr("CALC")?.extract()?;
+        let mut literals = Vec::new();
+        for part in vectors.iter() {
+            let part = part.get();
+            solver = PySolver::join(py, &solver, &part.solver)?;
+            literals.extend_from_slice(&part.literals);
+        }
+
+        let literals = literals.into_boxed_slice();
+        Ok(PyBitVec { solver, literals })
+    }
+
     /// Returns the associated solver for this bit vector. If the solver is
     /// `None``, then all literals are `TRUE`` or `FALSE``. Otherwise, the
     /// elements are literals of the solver and their value is not yet known.
@@ -126,6 +177,23 @@ impl PyBitVec {
         }
     }
 
+    /// Returns a new vector whose elements are the literals of this vector
+    /// at the given list of indices. Indices can be repeated.
+    pub fn gather(me: &Bound<'_, Self>, indices: Vec<usize>) -> PyResult<Self> {
+        let literals = &me.get().literals;
+        let mut result = Vec::with_capacity(indices.len());
+        for idx in indices {
+            if idx >= literals.len() {
+                return Err(PyIndexError::new_err("index out of range"));
+            }
+            result.push(literals[idx]);
+        }
+
+        let solver = me.get().solver.clone_ref(me.py());
+        let literals = result.into_boxed_slice();
+        Ok(PyBitVec { solver, literals })
+    }
+
     /// When this bit vector is backed by a solver and there exists a solution,
     /// then this method returns the value of these literals in the solution.
     pub fn solution(me: &Bound<'_, Self>) -> PyResult<Py<Self>> {
@@ -270,63 +338,81 @@ impl PyBitVec {
         Ok(res)
     }
 
-    pub fn fold_all(me: &Bound<'_, Self>) -> PyResult<Self> {
+    #[pyo3(signature = (step=None))]
+    pub fn fold_all(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<Self> {
         let solver = me.get().solver.clone_ref(me.py());
-        let mut res = PySolver::TRUE;
-        for lit in me.get().literals.iter() {
-            res = solver.get().bool_and(res, *lit)?;
-            if res == PySolver::FALSE {
-                break;
+        let mut literals = Vec::new();
+        for group in me.get().groups(step)? {
+            let mut res = PySolver::TRUE;
+            for lit in group.iter() {
+                res = solver.get().bool_and(res, *lit)?;
+                if res == PySolver::FALSE {
+                    break;
+                }
             }
+            literals.push(res);
         }
-        let literals = vec![res].into_boxed_slice();
+        let literals = literals.into_boxed_slice();
         Ok(PyBitVec { solver, literals })
     }
 
-    pub fn fold_any(me: &Bound<'_, Self>) -> PyResult<Self> {
+    #[pyo3(signature = (step=None))]
+    pub fn fold_any(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<Self> {
         let solver = me.get().solver.clone_ref(me.py());
-        let mut res = PySolver::FALSE;
-        for lit in me.get().literals.iter() {
-            res = solver.get().bool_or(res, *lit)?;
-            if res == PySolver::TRUE {
-                break;
+        let mut literals = Vec::new();
+        for group in me.get().groups(step)? {
+            let mut res = PySolver::FALSE;
+            for lit in group.iter() {
+                res = solver.get().bool_or(res, *lit)?;
+                if res == PySolver::TRUE {
+                    break;
+                }
             }
+            literals.push(res);
         }
-        let literals = vec![res].into_boxed_slice();
+        let literals = literals.into_boxed_slice();
         Ok(PyBitVec { solver, literals })
     }
 
-    pub fn fold_one(me: &Bound<'_, Self>) -> PyResult<Self> {
+    #[pyo3(signature = (step=None))]
+    pub fn fold_one(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<Self> {
         let solver = me.get().solver.clone_ref(me.py());
-        let mut min1 = PySolver::FALSE;
-        let mut min2 = PySolver::FALSE;
-        for lit in me.get().literals.iter() {
-            let tmp = solver.get().bool_and(min1, *lit)?;
-            min2 = solver.get().bool_or(min2, tmp)?;
-            min1 = solver.get().bool_or(min1, *lit)?;
-            if min2 == PySolver::TRUE {
-                break;
+        let mut literals = Vec::new();
+        for group in me.get().groups(step)? {
+            let mut min1 = PySolver::FALSE;
+            let mut min2 = PySolver::FALSE;
+            for lit in group.iter() {
+                let tmp = solver.get().bool_and(min1, *lit)?;
+                min2 = solver.get().bool_or(min2, tmp)?;
+                min1 = solver.get().bool_or(min1, *lit)?;
+                if min2 == PySolver::TRUE {
+                    break;
+                }
             }
+            literals.push(solver.get().bool_and(min1, PySolver::bool_not(min2))?);
         }
-        let res = solver.get().bool_and(min1, PySolver::bool_not(min2))?;
-        let literals = vec![res].into_boxed_slice();
+        let literals = literals.into_boxed_slice();
         Ok(PyBitVec { solver, literals })
     }
 
-    pub fn fold_amo(me: &Bound<'_, Self>) -> PyResult<Self> {
+    #[pyo3(signature = (step=None))]
+    pub fn fold_amo(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<Self> {
         let solver = me.get().solver.clone_ref(me.py());
-        let mut min1 = PySolver::FALSE;
-        let mut min2 = PySolver::FALSE;
-        for lit in me.get().literals.iter() {
-            let tmp = solver.get().bool_and(min1, *lit)?;
-            min2 = solver.get().bool_or(min2, tmp)?;
-            min1 = solver.get().bool_or(min1, *lit)?;
-            if min2 == PySolver::TRUE {
-                break;
+        let mut literals = Vec::new();
+        for group in me.get().groups(step)? {
+            let mut min1 = PySolver::FALSE;
+            let mut min2 = PySolver::FALSE;
+            for lit in group.iter() {
+                let tmp = solver.get().bool_and(min1, *lit)?;
+                min2 = solver.get().bool_or(min2, tmp)?;
+                min1 = solver.get().bool_or(min1, *lit)?;
+                if min2 == PySolver::TRUE {
+                    break;
+                }
             }
+            literals.push(PySolver::bool_not(min2));
         }
-        let res = PySolver::bool_not(min2);
-        let literals = vec![res].into_boxed_slice();
+        let literals = literals.into_boxed_slice();
         Ok(PyBitVec { solver, literals })
     }
 
@@ -387,51 +473,79 @@ impl PyBitVec {
         }
     }
 
-    pub fn ensure_one(me: &Bound<'_, Self>) -> PyResult<()> {
+    #[pyo3(signature = (step=None))]
+    pub fn ensure_one(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<()> {
         let solver = me.get().solver.get();
-        let mut min1 = PySolver::FALSE;
-        let mut min2 = PySolver::FALSE;
-        for lit in me.get().literals.iter() {
-            let tmp = solver.bool_and(min1, *lit)?;
-            min2 = solver.bool_or(min2, tmp)?;
-            min1 = solver.bool_or(min1, *lit)?;
-            if min2 == PySolver::TRUE {
-                break;
+        for group in me.get().groups(step)? {
+            let mut min1 = PySolver::FALSE;
+            let mut min2 = PySolver::FALSE;
+            for lit in group.iter() {
+                let tmp = solver.bool_and(min1, *lit)?;
+                min2 = solver.bool_or(min2, tmp)?;
+                min1 = solver.bool_or(min1, *lit)?;
+                if min2 == PySolver::TRUE {
+                    break;
+                }
             }
-        }
-        let res = solver.bool_and(min1, PySolver::bool_not(min2))?;
+            let res = solver.bool_and(min1, PySolver::bool_not(min2))?;
 
-        if res == PySolver::TRUE {
-            Ok(())
-        } else if res == PySolver::FALSE {
-            Err(PyAssertionError::new_err("not exactly one true"))
-        } else {
-            me.get().solver.get().add_clause1(res);
-            Ok(())
+            if res == PySolver::FALSE {
+                return Err(PyAssertionError::new_err("not exactly one true"));
+            } else if res != PySolver::TRUE {
+                solver.add_clause1(res);
+            }
         }
+        Ok(())
     }
 
-    pub fn ensure_amo(me: &Bound<'_, Self>) -> PyResult<()> {
+    #[pyo3(signature = (step=None))]
+    pub fn ensure_amo(me: &Bound<'_, Self>, step: Option<usize>) -> PyResult<()> {
         let solver = me.get().solver.get();
-        let mut min1 = PySolver::FALSE;
-        let mut min2 = PySolver::FALSE;
-        for lit in me.get().literals.iter() {
-            let tmp = solver.bool_and(min1, *lit)?;
-            min2 = solver.bool_or(min2, tmp)?;
-            min1 = solver.bool_or(min1, *lit)?;
-            if min2 == PySolver::TRUE {
-                break;
+        for group in me.get().groups(step)? {
+            let mut min1 = PySolver::FALSE;
+            let mut min2 = PySolver::FALSE;
+            for lit in group.iter() {
+                let tmp = solver.bool_and(min1, *lit)?;
+                min2 = solver.bool_or(min2, tmp)?;
+                min1 = solver.bool_or(min1, *lit)?;
+                if min2 == PySolver::TRUE {
+                    break;
+                }
+            }
+            let res = PySolver::bool_not(min2);
+
+            if res == PySolver::FALSE {
+                return Err(PyAssertionError::new_err("not at most one true"));
+            } else if res != PySolver::TRUE {
+                solver.add_clause1(res);
             }
         }
-        let res = PySolver::bool_not(min2);
+        Ok(())
+    }
 
-        if res == PySolver::TRUE {
-            Ok(())
-        } else if res == PySolver::FALSE {
-            Err(PyAssertionError::new_err("not at most one true"))
-        } else {
-            me.get().solver.get().add_clause1(res);
-            Ok(())
+    /// Makes sure that this bit vector is equal to the other one. If this is
+    /// a solver instance, then two binary clauses are added for each pair of
+    /// different literals. If this is a calculator instance, then an
+    /// assertion error is thrown if the two vectors are not equal. Note that
+    /// constant literals that disagree in a solver instance do not raise,
+    /// they make the instance unsatisfiable instead.
+    pub fn ensure_eq(me: &Bound<'_, Self>, other: &Self) -> PyResult<()> {
+        let solver = PySolver::join(me.py(), &me.get().solver, &other.solver)?;
+        if me.get().literals.len() != other.literals.len() {
+            return Err(PyValueError::new_err("length mismatch"));
+        }
+
+        let solver = solver.get();
+        for (&a, &b) in me.get().literals.iter().zip(other.literals.iter()) {
+            if a == b {
+                continue;
+            } else if solver.__bool__() {
+                solver.add_clause2(-a, b);
+                solver.add_clause2(a, -b);
+            } else {
+                return Err(PyAssertionError::new_err("not equal"));
+            }
         }
+        Ok(())
     }
 }
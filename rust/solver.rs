@@ -17,6 +17,7 @@
 
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use std::collections::HashMap;
 use std::sync::{Mutex, MutexGuard};
 use std::time::{Duration, SystemTime};
 
@@ -71,6 +72,28 @@ impl PySolver {
             Err(PyValueError::new_err("not joinable"))
         }
     }
+
+    /// Returns the disjunction of the given literals using a single new
+    /// variable, instead of a chain of binary disjunctions.
+    fn bool_or_all(&self, lits: &[i32]) -> PyResult<i32> {
+        if lits.contains(&Self::TRUE) {
+            Ok(Self::TRUE)
+        } else if lits.is_empty() {
+            Ok(Self::FALSE)
+        } else if lits.len() == 1 {
+            Ok(lits[0])
+        } else if let Some(s) = self.0.as_ref() {
+            let mut s = s.lock().unwrap();
+            let res = s.max_variable() + 1;
+            for &lit in lits {
+                s.add_clause([Self::bool_not(lit), res]);
+            }
+            s.add_clause(lits.iter().copied().chain([Self::bool_not(res)]));
+            Ok(res)
+        } else {
+            Err(PyValueError::new_err("calculator instance"))
+        }
+    }
 }
 
 #[allow(clippy::new_without_default)]
@@ -139,6 +162,19 @@ impl PySolver {
         }
     }
 
+    /// Returns the only solver in the given list of solvers which is not the
+    /// calculator instance, or the calculator instance if there is none. If
+    /// there are two different real solvers, then an error is returned.
+    #[staticmethod]
+    pub fn join_all(py: Python<'_>, solvers: Bound<'_, PyAny>) -> PyResult<Py<Self>> {
+        let mut res: Py<Self> = py.get_type::<PySolver>().getattr("CALC")?.extract()?;
+        for solver in solvers.try_iter()? {
+            let solver = solver?.extract::<Py<Self>>()?;
+            res = Self::join(py, &res, &solver)?;
+        }
+        Ok(res)
+    }
+
     /// Adds a new variable to the solver and returns the corresponding
     /// literal as an integer. If more than one is requested, then the
     /// first literal is returned and the rest are consecutive numbers.
@@ -449,6 +485,70 @@ impl PySolver {
         Ok(Self::bool_not(min2))
     }
 
+    /// Selects one of the rows of the literal matrix using the selector
+    /// literals. The matrix is given in row major order and has as many
+    /// rows as there are selector literals. For each column the disjunction
+    /// of the selector literals and-ed with the column entries is returned.
+    /// Identical columns share the same output literal, and each column is
+    /// encoded with a single disjunction over the selected rows.
+    pub fn fold_choice(&self, selector: Vec<i32>, literals: Vec<i32>) -> PyResult<Vec<i32>> {
+        if selector.is_empty() || literals.len() % selector.len() != 0 {
+            return Err(PyValueError::new_err("length mismatch"));
+        }
+
+        let length = literals.len() / selector.len();
+        if let Some(row) = selector.iter().position(|&sel| sel == Self::TRUE) {
+            if selector
+                .iter()
+                .enumerate()
+                .all(|(idx, &sel)| idx == row || sel == Self::FALSE)
+            {
+                return Ok(literals[row * length..(row + 1) * length].to_vec());
+            }
+        }
+
+        let mut result = Vec::with_capacity(length);
+        let mut columns: HashMap<Vec<i32>, i32> = HashMap::new();
+        for idx in 0..length {
+            let column: Vec<i32> = (0..selector.len())
+                .map(|row| literals[row * length + idx])
+                .collect();
+            if let Some(&res) = columns.get(&column) {
+                result.push(res);
+                continue;
+            }
+
+            let mut terms = Vec::with_capacity(selector.len());
+            for (&sel, &lit) in selector.iter().zip(column.iter()) {
+                let lit = self.bool_and(sel, lit)?;
+                if lit == Self::TRUE {
+                    terms = vec![lit];
+                    break;
+                } else if lit != Self::FALSE && !terms.contains(&lit) {
+                    terms.push(lit);
+                }
+            }
+            let res = self.bool_or_all(&terms)?;
+            columns.insert(column, res);
+            result.push(res);
+        }
+        Ok(result)
+    }
+
+    /// Returns the conjunctions of all pairs of literals from the two
+    /// sequences, where the second index changes fastest. Applied to the
+    /// one-hot encodings of two values, this gives the one-hot encoding of
+    /// the pair.
+    pub fn bool_and_outer(&self, lits0: Vec<i32>, lits1: Vec<i32>) -> PyResult<Vec<i32>> {
+        let mut result = Vec::with_capacity(lits0.len() * lits1.len());
+        for &lit0 in lits0.iter() {
+            for &lit1 in lits1.iter() {
+                result.push(self.bool_and(lit0, lit1)?);
+            }
+        }
+        Ok(result)
+    }
+
     /// Returns true if the two sequences are equal. The two sequences
     /// must have the same length.
     pub fn comp_eq(&self, lits0: Bound<'_, PyAny>, lits1: Bound<'_, PyAny>) -> PyResult<i32> {
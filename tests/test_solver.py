@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import pytest
 from typing import List
 from uasat import Solver, BitVec
 
@@ -36,6 +37,9 @@ def test_join():
     assert (solver | solver) is solver
     assert (Solver.CALC | Solver.CALC) is Solver.CALC
 
+    assert Solver.join_all([]) is Solver.CALC
+    assert Solver.join_all([Solver.CALC, solver, solver]) is solver
+
     other = Solver()
     try:
         unused = solver | other
@@ -43,6 +47,12 @@ def test_join():
     except ValueError:
         pass
 
+    try:
+        unused = Solver.join_all([solver, Solver.CALC, other])
+        assert False
+    except ValueError:
+        pass
+
 
 def test_calc():
     solver = Solver.CALC
@@ -81,6 +91,28 @@ def test_calc():
     assert solver.fold_amo([Solver.TRUE, Solver.FALSE]) == Solver.TRUE
     assert solver.fold_amo([Solver.TRUE, Solver.TRUE]) == Solver.FALSE
 
+    rows = [Solver.FALSE, Solver.TRUE, Solver.TRUE,
+            Solver.TRUE, Solver.FALSE, Solver.TRUE]
+    assert solver.fold_choice([Solver.TRUE, Solver.FALSE], rows) == rows[:3]
+    assert solver.fold_choice([Solver.FALSE, Solver.TRUE], rows) == rows[3:]
+    assert solver.fold_choice([Solver.TRUE, Solver.TRUE], rows) == \
+        [Solver.TRUE, Solver.TRUE, Solver.TRUE]
+
+    other = Solver()
+    sel = [other.add_variable(), other.add_variable()]
+    res = other.fold_choice(sel, [Solver.FALSE, Solver.TRUE, Solver.FALSE,
+                                  Solver.TRUE, Solver.FALSE, Solver.TRUE])
+    assert res[0] == sel[1] and res[1] == sel[0] and res[2] == res[0]
+
+    rows = [other.add_variable() for _ in range(4)]
+    assert other.fold_choice([Solver.FALSE, Solver.TRUE], rows) == rows[2:]
+
+    assert solver.bool_and_outer([Solver.FALSE, Solver.TRUE],
+                                 [Solver.TRUE, Solver.FALSE, Solver.FALSE]) == \
+        [Solver.FALSE, Solver.FALSE, Solver.FALSE,
+         Solver.TRUE, Solver.FALSE, Solver.FALSE]
+    assert other.bool_and_outer([Solver.TRUE], rows) == rows
+
 
 def test_bitvec():
     """
@@ -125,3 +157,109 @@ def test_bitvec():
             check(v1.comp_lt(v3), v2.comp_lt(v3))
             check(v1.comp_ge(v3), v2.comp_ge(v3))
             check(v1.comp_ge(v3), ~(v2.comp_lt(v3)))
+
+
+def test_one_hot():
+    v = BitVec.one_hot(3, [2, None, 0])
+    assert not v.solver
+    assert v.literals == [
+        Solver.FALSE, Solver.FALSE, Solver.TRUE,
+        Solver.FALSE, Solver.FALSE, Solver.FALSE,
+        Solver.TRUE, Solver.FALSE, Solver.FALSE,
+    ]
+    assert BitVec.one_hot(2, bytes([1, 0])).literals == \
+        [Solver.FALSE, Solver.TRUE, Solver.TRUE, Solver.FALSE]
+
+    try:
+        BitVec.one_hot(2, [2])
+        assert False
+    except ValueError:
+        pass
+
+
+def test_gather():
+    v = BitVec(Solver.CALC, [Solver.TRUE, Solver.FALSE, Solver.FALSE])
+    assert v.gather([2, 0, 0, 1]).literals == \
+        [Solver.FALSE, Solver.TRUE, Solver.TRUE, Solver.FALSE]
+    assert v.gather([]).literals == []
+
+    try:
+        v.gather([3])
+        assert False
+    except IndexError:
+        pass
+
+
+def test_ensure_eq():
+    v1 = BitVec(Solver.CALC, [Solver.TRUE, Solver.FALSE])
+    v1.ensure_eq(BitVec(Solver.CALC, [Solver.TRUE, Solver.FALSE]))
+
+    with pytest.raises(AssertionError):
+        v1.ensure_eq(BitVec(Solver.CALC, [Solver.TRUE, Solver.TRUE]))
+
+    solver = Solver()
+    v2 = BitVec.variable(solver, 2)
+    v2.ensure_eq(v1)
+    assert solver.solve()
+    assert v2.solution().literals == v1.literals
+
+    (~v2).ensure_eq(v1)
+    assert not solver.solve()
+
+    # disagreeing constants in a solver instance make it unsatisfiable
+    other = Solver()
+    BitVec(other, [Solver.TRUE]).ensure_eq(
+        BitVec(Solver.CALC, [Solver.FALSE]))
+    assert not other.solve()
+
+
+def test_fold_step():
+    v = BitVec(Solver.CALC, [Solver.FALSE, Solver.FALSE,
+                             Solver.FALSE, Solver.TRUE,
+                             Solver.TRUE, Solver.TRUE])
+    assert v.fold_any(2).literals == [Solver.FALSE, Solver.TRUE, Solver.TRUE]
+    assert v.fold_all(2).literals == [Solver.FALSE, Solver.FALSE, Solver.TRUE]
+    assert v.fold_one(2).literals == [Solver.FALSE, Solver.TRUE, Solver.FALSE]
+    assert v.fold_amo(2).literals == [Solver.TRUE, Solver.TRUE, Solver.FALSE]
+    assert v.fold_any(6).literals == v.fold_any().literals
+
+    try:
+        v.fold_any(4)
+        assert False
+    except ValueError:
+        pass
+
+    w = BitVec.variable(Solver(), 6)
+    w.ensure_one(3)
+    assert w.solver.solve()
+    assert [lit == Solver.TRUE
+            for lit in w.solution().literals].count(True) == 2
+
+    BitVec(Solver.CALC, [Solver.TRUE, Solver.FALSE,
+                         Solver.FALSE, Solver.TRUE]).ensure_one(2)
+    with pytest.raises(AssertionError):
+        BitVec(Solver.CALC, [Solver.TRUE, Solver.TRUE,
+                             Solver.FALSE, Solver.TRUE]).ensure_one(2)
+
+    BitVec(Solver.CALC, [Solver.TRUE, Solver.TRUE]).ensure_amo(1)
+    with pytest.raises(AssertionError):
+        BitVec(Solver.CALC, [Solver.TRUE, Solver.TRUE]).ensure_amo(2)
+
+
+def test_concat():
+    v1 = BitVec(Solver.CALC, [Solver.TRUE, Solver.FALSE])
+    v2 = BitVec(Solver.CALC, [Solver.FALSE])
+    v3 = BitVec.concat([v1, v2, v1])
+    assert not v3.solver
+    assert v3.literals == v1.literals + v2.literals + v1.literals
+    assert len(BitVec.concat([])) == 0
+
+    solver = Solver()
+    v4 = BitVec.concat([v1, BitVec.variable(solver, 1)])
+    assert v4.solver is solver and len(v4) == 3
+
+    try:
+        BitVec.concat([v4, BitVec.variable(Solver(), 1)])
+        assert False
+    except ValueError:
+        pass
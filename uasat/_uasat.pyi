@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Iterable, Optional
+from typing import List, Iterable, Optional, Sequence
 
 
 class Solver(object):
@@ -68,6 +68,14 @@ class Solver(object):
         different then an error is returned.
         """
 
+    @staticmethod
+    def join_all(solvers: Iterable[Solver]) -> Solver:
+        """
+        Returns the only solver in the given list of solvers which is not the
+        calculator instance, or the calculator instance if there is none. If
+        there are two different real solvers, then an error is returned.
+        """
+
     def add_variable(self, count: int = 1) -> int:
         """
         Adds a new variable to the solver and returns the corresponding
@@ -122,7 +130,7 @@ class Solver(object):
         of resources or was terminated, then an error is raised.
         """
 
-    def solve_with(self, assumptions: List[int]) -> bool:
+    def solve_with(self, assumptions: Sequence[int]) -> bool:
         """
         Solves the formula defined by the set of clauses under the given
         assumptions.
@@ -215,6 +223,23 @@ class Solver(object):
         Computes the at most one predicate over the given elements.
         """
 
+    def fold_choice(self, selector: Sequence[int], literals: Sequence[int]) -> List[int]:
+        """
+        Selects one of the rows of the literal matrix using the selector
+        literals. The matrix is given in row major order and has as many
+        rows as there are selector literals. For each column the disjunction
+        of the selector literals and-ed with the column entries is returned.
+        Identical columns share the same output literal.
+        """
+
+    def bool_and_outer(self, lits0: List[int], lits1: List[int]) -> List[int]:
+        """
+        Returns the conjunctions of all pairs of literals from the two
+        sequences, where the second index changes fastest. Applied to the
+        one-hot encodings of two values, this gives the one-hot encoding of
+        the pair.
+        """
+
     def comp_eq(self, lits0: Iterable[int], lits1: Iterable[int]) -> int:
         """
         Returns true if the two sequences are equal.
@@ -262,7 +287,7 @@ class BitVec(object):
     known.
     """
 
-    def __init__(self, solver: Solver, literals: List[int]):
+    def __init__(self, solver: Solver, literals: Sequence[int]):
         """
         Constructs a new bit vector instance. If the solver is the calculator,
         then all literals must be either TRUE or FALSE.
@@ -275,6 +300,22 @@ class BitVec(object):
         new literals from the solver.
         """
 
+    @staticmethod
+    def one_hot(size: int, values: Sequence[Optional[int]]) -> BitVec:
+        """
+        Constructs a new calculator bit vector that encodes the given list
+        of values in one-hot form. Each value occupies size many consecutive
+        literals, of which only the one at the position of the value is true.
+        Missing values are encoded with all literals false.
+        """
+
+    @staticmethod
+    def concat(vectors: Sequence[BitVec]) -> BitVec:
+        """
+        Returns the concatenation of the given bit vectors. The vectors must
+        belong to the same solver or to the calculator instance.
+        """
+
     @property
     def solver(self) -> Solver:
         """
@@ -311,6 +352,12 @@ class BitVec(object):
         Returns a subslice of this vector.
         """
 
+    def gather(self, indices: Sequence[int]) -> BitVec:
+        """
+        Returns a new vector whose elements are the literals of this vector
+        at the given list of indices. Indices can be repeated.
+        """
+
     def __repr__(self) -> str:
         """
         Returns the list of literals as a string.
@@ -385,28 +432,34 @@ class BitVec(object):
         one as seen as a binary number in little endian order.
         """
 
-    def fold_all(self) -> BitVec:
+    def fold_all(self, step: Optional[int] = None) -> BitVec:
         """
         Computes the conjunction of the elements and returns a single element
-        vector.
+        vector. If a step is given, then the conjunction is computed for each
+        consecutive block of step many elements and the results are returned.
         """
 
-    def fold_any(self) -> BitVec:
+    def fold_any(self, step: Optional[int] = None) -> BitVec:
         """
         Computes the disjunction of the elements and returns a single element
-        vector.
+        vector. If a step is given, then the disjunction is computed for each
+        consecutive block of step many elements and the results are returned.
         """
 
-    def fold_one(self) -> BitVec:
+    def fold_one(self, step: Optional[int] = None) -> BitVec:
         """
         Computes the exactly one predicate over the given elements and returns
-        a single element vector.
+        a single element vector. If a step is given, then the predicate is
+        computed for each consecutive block of step many elements and the
+        results are returned.
         """
 
-    def fold_amo(self) -> BitVec:
+    def fold_amo(self, step: Optional[int] = None) -> BitVec:
         """
         Computes the at most one predicate over the given elements and returns
-        a single element vector.
+        a single element vector. If a step is given, then the predicate is
+        computed for each consecutive block of step many elements and the
+        results are returned.
         """
 
     def ensure_true(self):
@@ -439,18 +492,30 @@ class BitVec(object):
         if all literals are false.
         """
 
-    def ensure_one(self):
+    def ensure_one(self, step: Optional[int] = None):
         """
         Makes sure that exactly one literal in this bit vector is true. If
         this is a solver instance, then a single clause is added to the solver.
         If this is a calculator instance, then an assertion error is thrown
-        if not exactly one literal is true.
+        if not exactly one literal is true. If a step is given, then this is
+        required for each consecutive block of step many elements.
         """
 
-    def ensure_amo(self):
+    def ensure_amo(self, step: Optional[int] = None):
         """
         Makes sure that at most one literal in this bit vector is true. If
         this is a solver instance, then a single clause is added to the solver.
         If this is a calculator instance, then an assertion error is thrown
-        if not at most one literal is true.
+        if not at most one literal is true. If a step is given, then this is
+        required for each consecutive block of step many elements.
+        """
+
+    def ensure_eq(self, other: BitVec):
+        """
+        Makes sure that this bit vector is equal to the other one. If this is
+        a solver instance, then two binary clauses are added for each pair of
+        different literals. If this is a calculator instance, then an
+        assertion error is thrown if the two vectors are not equal. Note that
+        constant literals that disagree in a solver instance do not raise,
+        they make the instance unsatisfiable instead.
         """
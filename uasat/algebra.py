@@ -94,27 +94,20 @@ class ProductAlg(Algebra):
         self.factors = list(factors)
 
     def apply(self, op: int, args: List[BitVec], partop: bool = False) -> BitVec:
-        solver = Solver.CALC
-        literals = []
+        parts = []
         start = 0
         for alg in self.factors:
             subargs = [arg.slice(start, start + alg.length) for arg in args]
-            part = alg.apply(op, subargs, partop)
-            solver |= part.solver
-            literals.extend(part.literals)
+            parts.append(alg.apply(op, subargs, partop))
             start += alg.length
         assert start == self.length
-        return BitVec(solver, literals)
+        return self.combine(parts)
 
     def combine(self, parts: Sequence[BitVec]) -> BitVec:
         assert len(parts) == len(self.factors)
-        solver = Solver.CALC
-        literals = []
-        for part in parts:
-            solver |= part.solver
-            literals += part.literals
-        assert len(literals) == self.length
-        return BitVec(solver, literals)
+        elem = BitVec.concat(parts)
+        assert len(elem) == self.length
+        return elem
 
     def splitup(self, elem: BitVec) -> List[BitVec]:
         assert len(elem) == self.length
@@ -43,11 +43,9 @@ class RelClone:
 
 
 def preserves(operations: Iterable[Operation], relations: Iterable[Relation]) -> BitVec:
-    t = BitVec(Solver.CALC, [Solver.TRUE])
-    for o in operations:
-        for r in relations:
-            t &= o.preserves(r)
-    return t
+    return BitVec.concat([o.preserves(r)
+                          for o in operations
+                          for r in relations]).fold_all()
 
 
 class FindRelClone:
@@ -235,6 +233,36 @@ class MinimalClones:
     def maltsev_condition(self, solver: Solver) -> List[Operation]:
         raise NotImplementedError()
 
+    def extend_relations(self, operations: List[Operation],
+                         relations: List[Relation]) -> List[Operation]:
+        """
+        Keeps appending relations of increasing arity to the given list that
+        are preserved by some maltsev condition operations but not by the
+        current ones, and returns the last such operations. A single solver
+        is used throughout: the found relations are added permanently, while
+        each candidate relation is only assumed, so learned clauses persist.
+        """
+        solver = Solver()
+        new_operations = self.maltsev_condition(solver)
+        preserves(new_operations, relations).ensure_true()
+
+        for relation_arity in range(1, self.max_relation_arity + 1):
+            while True:
+                new_relation = Relation.variable(
+                    self.size, relation_arity, solver)
+                test = preserves(new_operations, [new_relation]) & \
+                    ~preserves(operations, [new_relation])
+
+                if not solver.solve_with(test.literals):
+                    break
+
+                operations = [o.solution() for o in new_operations]
+                relation = new_relation.solution()
+                relations.append(relation)
+                preserves(new_operations, [relation]).ensure_true()
+
+        return operations
+
     def find_minimal(self, relations: List[Relation],
                      avoid_existing: bool = True) -> Optional[Clone]:
         """
@@ -273,22 +301,7 @@ class MinimalClones:
         operations = [o.solution() for o in operations]
         relations.extend([r.solution() for r in new_relations])
 
-        for relation_arity in range(1, self.max_relation_arity + 1):
-            while True:
-                solver = Solver()
-                new_operations = self.maltsev_condition(solver)
-                preserves(new_operations, relations).ensure_true()
-
-                new_relation = Relation.variable(
-                    self.size, relation_arity, solver)
-                preserves(new_operations, [new_relation]).ensure_true()
-                preserves(operations, [new_relation]).ensure_false()
-
-                if not solver.solve():
-                    break
-
-                operations = [o.solution() for o in new_operations]
-                relations.append(new_relation.solution())
+        operations = self.extend_relations(operations, relations)
 
         clone = Clone(operations, relations)
         print("Adding minimal clone", clone)
@@ -311,22 +324,7 @@ class MinimalClones:
 
         operations = [o.solution() for o in operations]
 
-        for relation_arity in range(1, self.max_relation_arity + 1):
-            while True:
-                solver = Solver()
-                new_operations = self.maltsev_condition(solver)
-                preserves(new_operations, relations).ensure_true()
-
-                new_relation = Relation.variable(
-                    self.size, relation_arity, solver)
-                preserves(new_operations, [new_relation]).ensure_true()
-                preserves(operations, [new_relation]).ensure_false()
-
-                if not solver.solve():
-                    break
-
-                operations = [o.solution() for o in new_operations]
-                relations.append(new_relation.solution())
+        operations = self.extend_relations(operations, relations)
 
         clone = Clone(operations, relations)
         print("Adding minimal clone", clone)
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from typing import List, Tuple, Dict, Any
+import functools
 import cotengra
 
 from .relation import Relation
@@ -45,12 +46,36 @@ def contract_pair(rel1: Relation,
     return rel3
 
 
-def contract(inputs: List[Tuple[Relation, Tuple[Any, ...]]],
-             output: Tuple[Any, ...]) -> Relation:
+@functools.lru_cache(maxsize=None)
+def contraction_plan(input_vars: Tuple[Tuple[Any, ...], ...],
+                     output: Tuple[Any, ...],
+                     sizes: Tuple[Tuple[Any, int], ...]) -> Tuple[Any, List[Tuple[Any, ...]]]:
+    """
+    Returns the root node and the list of pairwise contraction steps for
+    the given shape. The same shapes are contracted over and over again,
+    so the plans are cached.
+    """
     global OPTIMIZER
     if OPTIMIZER is None:
         OPTIMIZER = cotengra.ReusableHyperOptimizer()
 
+    # print(input_vars, output, sizes)
+    tree = OPTIMIZER.search(list(input_vars), output, dict(sizes))
+
+    steps = []
+    for a, b, c in tree.traverse():
+        var1 = tuple(tree.get_legs(b))
+        var2 = tuple(tree.get_legs(c))
+        if tree.root == a:
+            var3 = output
+        else:
+            var3 = tuple(tree.get_legs(a))
+        steps.append((a, b, var1, c, var2, var3))
+    return tree.root, steps
+
+
+def contract(inputs: List[Tuple[Relation, Tuple[Any, ...]]],
+             output: Tuple[Any, ...]) -> Relation:
     size_dict: Dict[Any, int] = dict()
     data = dict()
     input_vars = []
@@ -60,20 +85,13 @@ def contract(inputs: List[Tuple[Relation, Tuple[Any, ...]]],
                 assert size_dict[v] == rel.size
             else:
                 size_dict[v] = rel.size
-        input_vars.append(var)
+        input_vars.append(tuple(var))
         data[frozenset({idx})] = rel
 
-    # print(input_vars, output, size_dict)
-    tree = OPTIMIZER.search(input_vars, output, size_dict)
-
-    for a, b, c in tree.traverse():
-        var1 = tuple(tree.get_legs(b))
-        var2 = tuple(tree.get_legs(c))
-        if tree.root == a:
-            var3 = output
-        else:
-            var3 = tuple(tree.get_legs(a))
+    root, steps = contraction_plan(tuple(input_vars), tuple(output),
+                                   tuple(size_dict.items()))
 
+    for a, b, var1, c, var2, var3 in steps:
         rel1 = data[b]
         del data[b]
         rel2 = data[c]
@@ -82,4 +100,4 @@ def contract(inputs: List[Tuple[Relation, Tuple[Any, ...]]],
         data[a] = contract_pair(rel1, var1, rel2, var2, var3)
 
     assert len(data) == 1
-    return data[tree.root]
+    return data[root]
@@ -13,23 +13,36 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Optional, Sequence
+import functools
+from typing import List, Optional, Sequence, Tuple
 
 from ._uasat import BitVec, Solver
-from .relation import Relation
+from .relation import Relation, polymer_positions
+
+
+@functools.lru_cache(maxsize=None)
+def projection_literals(size: int, arity: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns the literals of the tables of all projections of the given
+    arity on the given size, indexed by the projected coordinate.
+    """
+    result = []
+    for coord in range(arity):
+        literals = []
+        for idx in range(size ** arity):
+            value = (idx // size ** coord) % size
+            literals.extend(Solver.TRUE if i == value else Solver.FALSE
+                            for i in range(size))
+        result.append(tuple(literals))
+    return tuple(result)
 
 
 class Operation:
-    def __init__(self, size: int, arity: int, table: BitVec | List[Optional[int]]):
+    def __init__(self, size: int, arity: int, table: BitVec | Sequence[Optional[int]]):
         assert size >= 1 and arity >= 0
 
         if not isinstance(table, BitVec):
-            table2 = [Solver.FALSE for _ in range(size * len(table))]
-            for idx, val in enumerate(table):
-                if val is not None:
-                    assert 0 <= val < size
-                    table2[idx * size + val] = Solver.TRUE
-            table = BitVec(Solver.CALC, table2)
+            table = BitVec.one_hot(size, table)
 
         assert len(table) == size ** (arity + 1)
         self.size = size
@@ -50,11 +63,10 @@ class Operation:
         length = size ** (arity + 1)
 
         table = BitVec.variable(solver, length)
-        for start in range(0, length, size):
-            if not partop:
-                table.slice(start, start + size).ensure_one()
-            else:
-                table.slice(start, start + size).ensure_amo()
+        if not partop:
+            table.ensure_one(size)
+        else:
+            table.ensure_amo(size)
 
         return Operation(size, arity, table)
 
@@ -74,29 +86,10 @@ class Operation:
         if new_arity is None:
             new_arity = max(new_vars) + 1
 
-        strides = [0 for _ in range(new_arity)]
-
-        length = self.size
-        for var in new_vars:
-            assert 0 <= var < new_arity
-            strides[var] += length
-            length *= self.size
-
-        pos = 0
-        table = []
-        indices = [0 for _ in range(new_arity)]
-        for _ in range(self.size ** new_arity):
-            for pos2 in range(pos, pos + self.size):
-                table.append(self.table[pos2])
-            for idx in range(new_arity):
-                pos += strides[idx]
-                indices[idx] += 1
-                if indices[idx] < self.size:
-                    break
-                indices[idx] = 0
-                pos -= strides[idx] * self.size
-
-        table = BitVec(self.solver, table)
+        # the output is the first coordinate of the relation
+        new_vars = (0, ) + tuple(var + 1 for var in new_vars)
+        positions = polymer_positions(self.size, new_vars, new_arity + 1)
+        table = self.table.gather(positions)
         return Operation(self.size, new_arity, table)
 
     def solution(self) -> 'Operation':
@@ -125,6 +118,24 @@ class Operation:
         new_arity = args[0].arity
         total = self.arity + 1 + new_arity
 
+        # calculator operations are composed value by value, which avoids
+        # the contraction over all size ** total tuples
+        if not self.solver and not any(arg.solver for arg in args):
+            assert all(arg.arity == new_arity for arg in args)
+            table = self.decode()
+            values = [arg.decode() for arg in args]
+            result = []
+            for idx in range(self.size ** new_arity):
+                pos = 0
+                for val in reversed(values):
+                    if val[idx] is None:
+                        pos = None
+                        break
+                    pos = pos * self.size + val[idx]
+                result.append(None if pos is None else table[pos])
+            if partop or None not in result:
+                return Operation(self.size, new_arity, result)
+
         # 0..arity-1: temporary, arity: output, arity+1..arity+new_arity: input
         rel = self.as_relation().polymer(
             [self.arity] + list(range(0, self.arity)),
@@ -141,6 +152,12 @@ class Operation:
         return Operation(self.size, new_arity, rel.table)
 
     def apply(self, rel: Relation) -> Relation:
+        # projections preserve every relation, no need to contract
+        if not self.solver and self.arity >= 1:
+            literals = tuple(self.table.literals)
+            if literals in projection_literals(self.size, self.arity):
+                return rel
+
         oper = self.as_relation()
         return rel.evaluate([oper for _ in range(rel.arity)])
 
@@ -192,11 +209,7 @@ class Constant(Operation):
         index: Optional[int],
     ) -> 'Constant':
         assert index is None or 0 <= index < size
-
-        table = [Solver.FALSE for _ in range(size)]
-        if index is not None:
-            table[index] = Solver.TRUE
-        return Constant(size, BitVec(Solver.CALC, table))
+        return Constant(size, BitVec.one_hot(size, [index]))
 
     @staticmethod
     def variable(  # pyright: ignore[reportIncompatibleMethodOverride]
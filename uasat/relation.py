@@ -13,11 +13,44 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 from typing import List, Optional, Sequence, Tuple
 
 from ._uasat import BitVec, Solver
 
 
+@functools.lru_cache(maxsize=None)
+def polymer_positions(size: int, new_vars: Tuple[int, ...], new_arity: int) -> Tuple[int, ...]:
+    """
+    Returns the list of positions in the table of a relation of arity
+    len(new_vars) whose entries make up the table of the polymer with
+    the given new variables. These are cached, since the same shapes are
+    used over and over again.
+    """
+    strides = [0 for _ in range(new_arity)]
+
+    length = 1
+    for var in new_vars:
+        assert 0 <= var < new_arity
+        strides[var] += length
+        length *= size
+
+    pos = 0
+    positions = []
+    indices = [0 for _ in range(new_arity)]
+    for _ in range(size ** new_arity):
+        positions.append(pos)
+        for idx in range(new_arity):
+            pos += strides[idx]
+            indices[idx] += 1
+            if indices[idx] < size:
+                break
+            indices[idx] = 0
+            pos -= strides[idx] * size
+
+    return tuple(positions)
+
+
 class Relation:
     def __init__(self, size: int, arity: int, table: BitVec | List[bool]):
         assert size >= 1 and arity >= 0
@@ -107,28 +140,8 @@ class Relation:
         if new_arity is None:
             new_arity = max(new_vars) + 1
 
-        strides = [0 for _ in range(new_arity)]
-
-        length = 1
-        for var in new_vars:
-            assert 0 <= var < new_arity
-            strides[var] += length
-            length *= self.size
-
-        pos = 0
-        table = []
-        indices = [0 for _ in range(new_arity)]
-        for _ in range(self.size ** new_arity):
-            table.append(self.table[pos])
-            for idx in range(new_arity):
-                pos += strides[idx]
-                indices[idx] += 1
-                if indices[idx] < self.size:
-                    break
-                indices[idx] = 0
-                pos -= strides[idx] * self.size
-
-        table = BitVec(self.solver, table)
+        positions = polymer_positions(self.size, tuple(new_vars), new_arity)
+        table = self.table.gather(positions)
         return Relation(self.size, new_arity, table)
 
     def polymer_swap(self, var0: int, var1: int) -> 'Relation':
@@ -157,12 +170,7 @@ class Relation:
             count = self.arity
         assert 0 <= count <= self.arity
 
-        step = self.size ** count
-        table = []
-        for idx in range(0, self.length, step):
-            part = self.table.slice(idx, idx + step)
-            table.append(self.solver.fold_any(part.literals))
-        table = BitVec(self.solver, table)
+        table = self.table.fold_any(self.size ** count)
         return Relation(self.size, self.arity - count, table)
 
     def fold_all(self, count: Optional[int] = None) -> 'Relation':
@@ -170,12 +178,7 @@ class Relation:
             count = self.arity
         assert 0 <= count <= self.arity
 
-        step = self.size ** count
-        table = []
-        for idx in range(0, self.length, step):
-            part = self.table.slice(idx, idx + step)
-            table.append(self.solver.fold_all(part.literals))
-        table = BitVec(self.solver, table)
+        table = self.table.fold_all(self.size ** count)
         return Relation(self.size, self.arity - count, table)
 
     def fold_one(self, count: Optional[int] = None) -> 'Relation':
@@ -183,12 +186,7 @@ class Relation:
             count = self.arity
         assert 0 <= count <= self.arity
 
-        step = self.size ** count
-        table = []
-        for idx in range(0, self.length, step):
-            part = self.table.slice(idx, idx + step)
-            table.append(self.solver.fold_one(part.literals))
-        table = BitVec(self.solver, table)
+        table = self.table.fold_one(self.size ** count)
         return Relation(self.size, self.arity - count, table)
 
     def fold_amo(self, count: Optional[int] = None) -> 'Relation':
@@ -196,12 +194,7 @@ class Relation:
             count = self.arity
         assert 0 <= count <= self.arity
 
-        step = self.size ** count
-        table = []
-        for idx in range(0, self.length, step):
-            part = self.table.slice(idx, idx + step)
-            table.append(self.solver.fold_amo(part.literals))
-        table = BitVec(self.solver, table)
+        table = self.table.fold_amo(self.size ** count)
         return Relation(self.size, self.arity - count, table)
 
     def ensure_true(self):